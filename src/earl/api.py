@@ -0,0 +1,276 @@
+import copy
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TypeVar
+
+from earl import store
+from earl.browsers import (
+    CHROME_LOCAL_STATE_FILE_NAME,
+    ChromeLaunch,
+    get_chrome_profiles,
+    get_chrome_support_dir,
+    open_urls,
+    resolve_chrome_profile,
+)
+from earl.capture import ProjectConfig, parse_project
+from earl.config import (
+    find_project_file,
+    get_group_urls,
+    get_store_file,
+    get_urls_file,
+    iter_url_rows,
+    load_toml,
+)
+from earl.fuzzy import DEFAULT_LIMIT, FuzzyCandidate, build_candidates, fuzzy_search
+
+T = TypeVar("T")
+
+# (mtime_ns, size) per file; None for a missing file
+FileStamp = tuple[tuple[int, int] | None, ...]
+
+
+# =====================================================================================================================
+@dataclass(frozen=True, slots=True)
+class UrlEntry:
+    group: str
+    name: str
+    url: str
+
+
+# =====================================================================================================================
+@dataclass(frozen=True, slots=True)
+class SearchResult:
+    group: str
+    name: str
+    url: str
+    score: int
+
+
+# =====================================================================================================================
+@dataclass(frozen=True, slots=True)
+class _UrlCollection:
+    groups: list[str]
+    urls_by_group: dict[str, dict[str, str]]
+    entries: list[UrlEntry]
+    candidates: list[FuzzyCandidate]
+
+
+# =====================================================================================================================
+class _FileCache:
+    """
+    Process-wide cache of values parsed from files, for long-running callers (editor plugins, launchers).
+
+    An entry is reloaded when the mtime or size of any of its source files changes. Thread-safe: concurrent
+    callers of one key share a single load, and a slow load never blocks other keys.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._entries: dict[str, tuple[FileStamp, object]] = {}
+
+    def get(self, key: str, paths: list[Path], loader: Callable[[], T]) -> T:
+        stamp = _stamp(paths)
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached and cached[0] == stamp:
+                return cached[1]  # type: ignore[return-value]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Another caller may have loaded this key while we waited
+            with self._lock:
+                cached = self._entries.get(key)
+            if cached and cached[0] == stamp:
+                return cached[1]  # type: ignore[return-value]
+
+            value = loader()
+            with self._lock:
+                self._entries[key] = (stamp, value)
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_cache = _FileCache()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def clear_cache() -> None:
+    """Drop all cached state (the next call reloads from disk)."""
+    _cache.clear()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def list_groups(prefix: str = "") -> list[str]:
+    """Group paths, optionally only `prefix` and groups nested under it."""
+    groups = _url_collection().groups
+    if not prefix:
+        return list(groups)
+
+    return [group for group in groups if group == prefix or group.startswith(f"{prefix}.")]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def get_urls(group: str) -> dict[str, str]:
+    """URL name -> URL for one group (empty if the group does not exist)."""
+    return dict(_url_collection().urls_by_group.get(group, {}))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def lookup_url(group: str, name: str) -> str | None:
+    """URL for `name` in `group`, or None."""
+    return _url_collection().urls_by_group.get(group, {}).get(name)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def search(query: str, limit: int = DEFAULT_LIMIT) -> list[SearchResult]:
+    """Fuzzy-search 'group > name' rows, best first (same ranking as `earl go`)."""
+    collection = _url_collection()
+    matches = fuzzy_search(collection.candidates, query, limit=limit)
+
+    results: list[SearchResult] = []
+    for match in matches:
+        entry = collection.entries[match.index]
+        results.append(SearchResult(group=entry.group, name=entry.name, url=entry.url, score=match.score))
+    return results
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def find_project(start: Path | str | None = None) -> Path | None:
+    """Nearest `.earl.toml` in `start` (default: current directory) or its parents."""
+    return find_project_file(Path(start).expanduser().resolve() if start else None)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def load_project(project_file: Path | str) -> ProjectConfig:
+    """
+    Parsed `.earl.toml`, cached until the file changes (each call returns its own copy of the lists).
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If it has no [[urls]] array
+    """
+    path = Path(project_file).expanduser().resolve()
+    project = _cache.get(f"project:{path}", [path], lambda: parse_project(load_toml(path)))
+    return replace(project, urls=list(project.urls), malformed=copy.deepcopy(project.malformed))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def chrome_profiles() -> dict[str, str]:
+    """Chrome profiles (directory -> name), cached until Chrome's Local State changes."""
+    local_state = get_chrome_support_dir() / CHROME_LOCAL_STATE_FILE_NAME
+    return dict(_cache.get(f"chrome-profiles:{local_state}", [local_state], get_chrome_profiles))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def resolve_profile(profile: str) -> str:
+    """Chrome profile name or directory -> directory (uses the cached profile state)."""
+    return resolve_chrome_profile(profile, chrome_profiles()) if profile else ""
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def open_url(url: str) -> None:
+    """Open one URL in the default browser."""
+    open_urls("default", [url])
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def open_group(group: str, *, browser: str = "default", chrome_profile: str = "") -> ChromeLaunch | None:
+    """
+    Open every URL in `group` in one window.
+
+    Raises:
+        KeyError: If the group has no URLs
+    """
+    urls = get_urls(group)
+    if not urls:
+        raise KeyError(group)
+
+    return open_urls(browser, list(urls.values()), chrome_profile=resolve_profile(chrome_profile))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def open_project(project_file: Path | str, *, incognito: bool = False) -> ChromeLaunch | None:
+    """
+    Open a project's URLs with its browser options (pinned tabs included).
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If it has no [[urls]] array, or no valid URL entries
+    """
+    project = load_project(project_file)
+    if not project.urls:
+        raise ValueError(f"No URLs in {project_file}")
+
+    return open_urls(
+        project.browser,
+        [url.url for url in project.urls],
+        pinned_indices=[idx for idx, url in enumerate(project.urls) if url.pinned],
+        chrome_profile=resolve_profile(project.chrome_profile),
+        incognito=incognito,
+    )
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _url_collection() -> _UrlCollection:
+    store_file = get_store_file()
+    if store_file.exists():
+        # WAL writes land in urls.db-wal before they are checkpointed into urls.db
+        paths = [store_file, store_file.with_name(f"{store_file.name}-wal")]
+        return _cache.get(f"store:{store_file}", paths, lambda: _load_store_collection(store_file))
+
+    urls_file = get_urls_file()
+    return _cache.get(f"toml:{urls_file}", [urls_file], lambda: _load_toml_collection(urls_file))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _load_store_collection(store_file: Path) -> _UrlCollection:
+    with store.open_store(store_file) as conn:
+        return _build_collection(list(store.iter_urls(conn)))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _load_toml_collection(urls_file: Path) -> _UrlCollection:
+    if not urls_file.exists():
+        return _build_collection([])
+
+    data = load_toml(urls_file)
+    collection = _build_collection(list(iter_url_rows(data)))
+    # Keep the TOML backend's own lookup semantics for groups
+    for group in collection.groups:
+        collection.urls_by_group[group] = get_group_urls(data, group)
+    return collection
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _build_collection(rows: list[tuple[str, str, str]]) -> _UrlCollection:
+    urls_by_group: dict[str, dict[str, str]] = {}
+    for group, name, url in rows:
+        urls_by_group.setdefault(group, {})[name] = url
+
+    entries = [UrlEntry(group=group, name=name, url=url) for group, name, url in rows]
+    return _UrlCollection(
+        groups=sorted(urls_by_group),
+        urls_by_group=urls_by_group,
+        entries=entries,
+        candidates=build_candidates([f"{entry.group} > {entry.name}" for entry in entries]),
+    )
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _stamp(paths: list[Path]) -> FileStamp:
+    stamps: list[tuple[int, int] | None] = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            stamps.append(None)
+        else:
+            stamps.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stamps)
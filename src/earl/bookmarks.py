@@ -0,0 +1,335 @@
+import json
+import re
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urlparse
+
+from loguru import logger
+
+from earl import store
+from earl.browsers import get_chrome_support_dir
+from earl.config import (
+    get_bookmarks_state_file,
+    get_store_file,
+    get_subgroup_keys,
+    get_urls_file,
+    load_toml,
+    update_urls_toml,
+)
+
+BOOKMARKS_FILE_NAME = "Bookmarks"
+DEFAULT_GROUP_PREFIX = "chrome"
+
+NODE_TYPE_URL = "url"
+NODE_TYPE_FOLDER = "folder"
+
+SLUG_RE = re.compile(r"[^a-z0-9_-]+")
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+# =====================================================================================================================
+@dataclass(frozen=True, slots=True)
+class BookmarkNode:
+    id: str
+    group: str
+    title: str
+    url: str
+
+
+# =====================================================================================================================
+@dataclass(frozen=True, slots=True)
+class ChromeBookmarks:
+    checksum: str
+    nodes: dict[str, BookmarkNode]
+
+
+# =====================================================================================================================
+@dataclass(frozen=True, slots=True)
+class BookmarkImportResult:
+    skipped: bool
+    added: int
+    removed: int
+    target: Path
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def get_bookmarks_file(profile_dir: str) -> Path:
+    """Path to a Chrome profile's `Bookmarks` JSON file."""
+    return get_chrome_support_dir() / profile_dir / BOOKMARKS_FILE_NAME
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def read_chrome_bookmarks(path: Path, prefix: str = DEFAULT_GROUP_PREFIX) -> ChromeBookmarks:
+    """
+    Parse a Chrome `Bookmarks` file into URL nodes keyed by node id.
+
+    Folders become dot-groups under `prefix`, e.g. Bookmarks bar > Work > AWS -> "chrome.bookmark_bar.work.aws".
+    """
+    data = json.loads(path.read_text(encoding="utf-8"))
+    nodes: dict[str, BookmarkNode] = {}
+
+    roots = data.get("roots", {})
+    if isinstance(roots, dict):
+        for root_key, root in roots.items():
+            if isinstance(root, dict):
+                _collect_nodes(root, f"{prefix}.{_slug(root_key)}", nodes)
+
+    checksum = data.get("checksum")
+    return ChromeBookmarks(checksum=checksum if isinstance(checksum, str) else "", nodes=nodes)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def import_chrome_bookmarks(
+    profile_dir: str,
+    *,
+    prefix: str = DEFAULT_GROUP_PREFIX,
+    force: bool = False,
+) -> BookmarkImportResult:
+    """
+    Import a Chrome profile's bookmarks into the URL store (urls.db if present, else urls.toml).
+
+    Nothing is parsed when the Bookmarks file is untouched since the last import, and nothing is written when its
+    checksum is unchanged. Otherwise only bookmarks added, removed or changed since the last import are applied.
+
+    urls.toml is edited in place (comments and layout are kept).
+
+    Raises:
+        FileNotFoundError: If the profile has no Bookmarks file
+        json.JSONDecodeError: If the Bookmarks file is not valid JSON
+        ValueError: If urls.toml cannot be edited in place (nothing is written)
+    """
+    bookmarks_file = get_bookmarks_file(profile_dir)
+    stat = bookmarks_file.stat()
+
+    store_file = get_store_file()
+    target = store_file if store_file.exists() else get_urls_file()
+
+    state_file = get_bookmarks_state_file()
+    state = _load_state(state_file)
+    profile_state = state.get(profile_dir, {})
+
+    # Same prefix as last time: cheap stat check first, then Chrome's own checksum
+    incremental = not force and profile_state.get("prefix") == prefix
+    if incremental and profile_state.get("mtime_ns") == stat.st_mtime_ns and profile_state.get("size") == stat.st_size:
+        return BookmarkImportResult(skipped=True, added=0, removed=0, target=target)
+
+    bookmarks = read_chrome_bookmarks(bookmarks_file, prefix)
+
+    if incremental and bookmarks.checksum and profile_state.get("checksum") == bookmarks.checksum:
+        profile_state.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        state[profile_dir] = profile_state
+        _save_state(state_file, state)
+        return BookmarkImportResult(skipped=True, added=0, removed=0, target=target)
+
+    # Prefix changes and forced imports still remove what the previous import added
+    previous: dict[str, list[str]] = profile_state.get("entries", {})
+    replace_all = not incremental
+
+    removed = {
+        node_id: entry
+        for node_id, entry in previous.items()
+        if replace_all
+        or node_id not in bookmarks.nodes
+        or _signature(bookmarks.nodes[node_id]) != _entry_signature(entry)
+    }
+    added_nodes = [node for node_id, node in bookmarks.nodes.items() if node_id not in previous or node_id in removed]
+
+    entries = {node_id: entry for node_id, entry in previous.items() if node_id not in removed}
+
+    if removed or added_nodes:
+        if target == store_file:
+            with store.open_store(store_file) as conn:
+                new_entries = _apply_to_store(conn, list(removed.values()), added_nodes)
+        else:
+            new_entries = _apply_to_toml(target, list(removed.values()), added_nodes)
+        entries.update(new_entries)
+        logger.info("Applied {} added / {} removed bookmarks to {}", len(added_nodes), len(removed), target)
+
+    state[profile_dir] = {
+        "prefix": prefix,
+        "checksum": bookmarks.checksum,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "entries": entries,
+    }
+    _save_state(state_file, state)
+
+    return BookmarkImportResult(skipped=False, added=len(added_nodes), removed=len(removed), target=target)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _collect_nodes(node: dict, group: str, nodes: dict[str, BookmarkNode]) -> None:
+    for child in node.get("children", []):
+        if not isinstance(child, dict):
+            continue
+
+        node_type = child.get("type")
+        if node_type == NODE_TYPE_FOLDER:
+            _collect_nodes(child, f"{group}.{_slug(str(child.get('name', '')))}", nodes)
+            continue
+
+        url = child.get("url")
+        node_id = child.get("id")
+        if node_type != NODE_TYPE_URL or not isinstance(url, str) or not url or node_id is None:
+            continue
+
+        title = child.get("name")
+        nodes[str(node_id)] = BookmarkNode(
+            id=str(node_id),
+            group=group,
+            title=WHITESPACE_RE.sub(" ", title).strip() if isinstance(title, str) else "",
+            url=url,
+        )
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _apply_to_store(
+    conn: sqlite3.Connection, removed: list[list[str]], added: list[BookmarkNode]
+) -> dict[str, list[str]]:
+    store.remove_urls_by_url(conn, [(entry[0], entry[1], entry[3]) for entry in removed])
+
+    # A link and a folder with the same key (link "work" next to folder "Work") cannot both exist in urls.toml
+    subgroups = get_subgroup_keys([*store.flatten_groups(conn), *(node.group for node in added)])
+    used_names: dict[str, set[str]] = {}
+    rows: list[tuple[str, str, str]] = []
+    entries: dict[str, list[str]] = {}
+
+    with conn:
+        for parent, keys in get_subgroup_keys(node.group for node in added).items():
+            names = set(store.get_group_urls(conn, parent))
+            used = names | subgroups[parent]
+            for key in keys & names:
+                new_name = _unique_name(key, used)
+                conn.execute("UPDATE urls SET name = ? WHERE group_path = ? AND name = ?", (new_name, parent, key))
+                logger.info("Renamed '{}' in {} to '{}' to make room for a folder", key, parent, new_name)
+
+    for node in added:
+        names = used_names.get(node.group)
+        if names is None:
+            names = set(store.get_group_urls(conn, node.group)) | subgroups.get(node.group, set())
+            used_names[node.group] = names
+
+        name = _unique_name(_node_name(node), names)
+        rows.append((node.group, name, node.url))
+        entries[node.id] = _entry(node, name)
+
+    store.add_urls(conn, rows)
+    return entries
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _apply_to_toml(path: Path, removed: list[list[str]], added: list[BookmarkNode]) -> dict[str, list[str]]:
+    # Work out the edits on the parsed data, then apply them to the file line by line so the user's comments and
+    # layout survive
+    data = load_toml(path) if path.exists() else {}
+    removed_keys: list[tuple[str, str]] = []
+    renamed: list[tuple[str, str, str]] = []
+    added_rows: list[tuple[str, str, str]] = []
+
+    for entry in removed:
+        group = _get_group_dict(data, entry[0], create=False, renamed=renamed)
+        if group is not None and (name := _find_url_name(group, entry[1], entry[3])) is not None:
+            del group[name]
+            removed_keys.append((entry[0], name))
+
+    # Folders added in this batch reserve their keys before any link takes the same name
+    subgroups = get_subgroup_keys(node.group for node in added)
+    entries: dict[str, list[str]] = {}
+
+    for node in added:
+        group = _get_group_dict(data, node.group, create=True, renamed=renamed)
+        name = _unique_name(_node_name(node), set(group) | subgroups.get(node.group, set()))
+        group[name] = node.url
+        added_rows.append((node.group, name, node.url))
+        entries[node.id] = _entry(node, name)
+
+    update_urls_toml(path, removed=removed_keys, renamed=renamed, added=added_rows)
+    return entries
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _get_group_dict(data: dict, group_path: str, *, create: bool, renamed: list[tuple[str, str, str]]) -> dict | None:
+    value = data
+    parts = group_path.split(".")
+    for depth, key in enumerate(parts):
+        child = value.get(key)
+        if not isinstance(child, dict):
+            if not create:
+                return None
+            if key in value:
+                # An existing link has the folder's key: keep it under a new name rather than overwrite it
+                new_name = _unique_name(key, set(value))
+                value[new_name] = value.pop(key)
+                renamed.append((".".join(parts[:depth]), key, new_name))
+                logger.info("Renamed '{}' to '{}' to make room for a folder", key, new_name)
+            child = value[key] = {}
+        value = child
+    return value
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _find_url_name(group: dict, name: str, url: str) -> str | None:
+    # Entries may have been renamed since import (e.g. by `earl enrich`), so match on URL, preferring the same name
+    if group.get(name) == url:
+        return name
+    return next((key for key, value in group.items() if value == url), None)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _node_name(node: BookmarkNode) -> str:
+    return node.title or urlparse(node.url).netloc or node.url
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _unique_name(base_name: str, used: set[str]) -> str:
+    name = base_name
+    count = 1
+
+    while name in used:
+        count += 1
+        name = f"{base_name} ({count})"
+
+    used.add(name)
+    return name
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _entry(node: BookmarkNode, name: str) -> list[str]:
+    # [group, name written to the URL store, source title, url]; removals match on group + url
+    return [node.group, name, node.title, node.url]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _signature(node: BookmarkNode) -> tuple[str, str, str]:
+    return node.group, node.title, node.url
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _entry_signature(entry: list[str]) -> tuple[str, str, str]:
+    return entry[0], entry[2], entry[3]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _slug(value: str) -> str:
+    return SLUG_RE.sub("-", value.lower()).strip("-") or "untitled"
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _load_state(path: Path) -> dict:
+    if not path.exists():
+        return {}
+
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        logger.warning("Ignoring unreadable bookmarks import state at {}", path)
+        return {}
+
+    return state if isinstance(state, dict) else {}
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _save_state(path: Path, state: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(state, indent=2), encoding="utf-8")
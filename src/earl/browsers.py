@@ -1,4 +1,5 @@
 import json
+import os
 import subprocess
 import time
 from dataclasses import dataclass
@@ -6,13 +7,21 @@ from pathlib import Path
 
 from loguru import logger
 
+BROWSER_CHROME = "chrome"
+BROWSER_SAFARI = "safari"
+
 CHROME_APP_NAME = "Google Chrome"
 SAFARI_APP_NAME = "Safari"
 OPEN_BIN = "open"
 OSASCRIPT_BIN = "osascript"
+PGREP_BIN = "pgrep"
+
+CHROME_BIN = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+CHROME_BIN_ENV = "EARL_CHROME_BIN"
 
 CHROME_SUPPORT_DIR = Path.home() / "Library/Application Support/Google/Chrome"
-CHROME_LOCAL_STATE_PATH = CHROME_SUPPORT_DIR / "Local State"
+CHROME_SUPPORT_DIR_ENV = "EARL_CHROME_SUPPORT_DIR"
+CHROME_LOCAL_STATE_FILE_NAME = "Local State"
 
 DEFAULT_PROFILE_DIR = "Default"
 PROFILE_DIR_PREFIX = "Profile "
@@ -20,6 +29,33 @@ PROFILE_DIR_PREFIX = "Profile "
 TAB_MENU_NAME = "Tab"
 PIN_TAB_MENU_ITEM = "Pin Tab"
 
+LAUNCH_OSASCRIPT = "osascript"
+LAUNCH_PROFILE_PROCESS = "profile-process"
+LAUNCH_COLD_START = "open -na"
+LAUNCH_BINARY_COLD_START = "chrome binary"
+
+CHROME_HANDOFF_TIMEOUT_SECONDS = 5.0
+
+# How long to wait for the new window before pinning tabs
+PIN_DELAY_COLD_SECONDS = 2.0
+PIN_DELAY_WARM_SECONDS = 0.5
+
+CHROME_NEW_WINDOW_SCRIPT = """
+function run(argv) {
+  const chrome = Application("Google Chrome");
+  const incognito = argv[0] === "1";
+  const urls = argv.slice(1);
+
+  const win = incognito ? chrome.Window({ mode: "incognito" }).make() : chrome.Window().make();
+  win.activeTab.url = urls[0];
+  for (const url of urls.slice(1)) {
+    win.tabs.push(chrome.Tab({ url: url }));
+  }
+  win.activeTabIndex = 1;
+  chrome.activate();
+}
+""".strip()
+
 
 # =====================================================================================================================
 @dataclass(frozen=True, slots=True)
@@ -28,13 +64,30 @@ class BrowserTab:
     url: str
 
 
+# =====================================================================================================================
+@dataclass(frozen=True, slots=True)
+class ChromeLaunch:
+    method: str
+    seconds: float
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def get_chrome_support_dir() -> Path:
+    """Chrome's user data directory ($EARL_CHROME_SUPPORT_DIR overrides, e.g. for fixture files)."""
+    if support_dir := os.getenv(CHROME_SUPPORT_DIR_ENV):
+        return Path(support_dir).expanduser()
+
+    return CHROME_SUPPORT_DIR
+
+
 # ----------------------------------------------------------------------------------------------------------------------
 def get_chrome_profiles() -> dict[str, str]:
     """Get Chrome profiles mapping directory name -> profile name."""
-    if not CHROME_LOCAL_STATE_PATH.exists():
+    local_state_path = get_chrome_support_dir() / CHROME_LOCAL_STATE_FILE_NAME
+    if not local_state_path.exists():
         return {}
 
-    data = json.loads(CHROME_LOCAL_STATE_PATH.read_text(encoding="utf-8"))
+    data = json.loads(local_state_path.read_text(encoding="utf-8"))
     profiles = data.get("profile", {}).get("info_cache", {})
 
     result: dict[str, str] = {}
@@ -48,12 +101,13 @@ def get_chrome_profiles() -> dict[str, str]:
 
 
 # ----------------------------------------------------------------------------------------------------------------------
-def resolve_chrome_profile(profile_input: str) -> str:
-    """Resolve Chrome profile name -> directory name."""
+def resolve_chrome_profile(profile_input: str, profiles: dict[str, str] | None = None) -> str:
+    """Resolve Chrome profile name -> directory name (`profiles` defaults to reading Local State)."""
     if profile_input == DEFAULT_PROFILE_DIR or profile_input.startswith(PROFILE_DIR_PREFIX):
         return profile_input
 
-    profiles = get_chrome_profiles()
+    if profiles is None:
+        profiles = get_chrome_profiles()
     profile_lower = profile_input.lower()
 
     for profile_dir, profile_name in profiles.items():
@@ -179,31 +233,52 @@ def get_safari_front_window_tabs() -> list[BrowserTab]:
     return tabs
 
 
+# ----------------------------------------------------------------------------------------------------------------------
+def get_chrome_bin() -> str:
+    """Chrome executable ($EARL_CHROME_BIN overrides, e.g. with a stub for testing)."""
+    return os.getenv(CHROME_BIN_ENV) or CHROME_BIN
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def is_chrome_running() -> bool:
+    """True if the current user has a Chrome browser process running."""
+    try:
+        result = subprocess.run(
+            [PGREP_BIN, "-u", str(os.getuid()), "-x", CHROME_APP_NAME], capture_output=True, text=True, check=False
+        )
+    except FileNotFoundError:
+        return False
+
+    return result.returncode == 0
+
+
 # ----------------------------------------------------------------------------------------------------------------------
 def open_urls_chrome(
     urls: list[str], pinned_indices: list[int] | None = None, profile: str = "", incognito: bool = False
-) -> None:
-    """Open URLs in Chrome with optional profile and pinned tabs."""
-    if not urls:
-        return
+) -> ChromeLaunch | None:
+    """
+    Open URLs in a new Chrome window with optional profile and pinned tabs.
 
-    profile_dir = resolve_chrome_profile(profile) if profile and not incognito else ""
+    When Chrome is already running, the window is added to it: through one osascript call (no profile), or by
+    handing the URLs to the running profile process via Chrome's own binary. `open -na` is only used to cold-start.
 
-    cmd = [OPEN_BIN, "-na", CHROME_APP_NAME, "--args"]
-    if incognito:
-        cmd.append("--incognito")
-    elif profile_dir:
-        cmd.append(f"--profile-directory={profile_dir}")
+    Returns:
+        ChromeLaunch describing the path taken and how long dispatch took, or None if there was nothing to open
+    """
+    if not urls:
+        return None
 
-    cmd.append("--new-window")
-    cmd.extend(urls)
+    profile_dir = resolve_chrome_profile(profile) if profile and not incognito else ""
 
-    subprocess.run(cmd, check=False)
+    started = time.monotonic()
+    method = _dispatch_chrome_window(urls, profile_dir=profile_dir, incognito=incognito)
+    launch = ChromeLaunch(method=method, seconds=time.monotonic() - started)
 
     if not pinned_indices:
-        return
+        return launch
 
-    time.sleep(2)
+    cold = method in {LAUNCH_COLD_START, LAUNCH_BINARY_COLD_START}
+    time.sleep(PIN_DELAY_COLD_SECONDS if cold else PIN_DELAY_WARM_SECONDS)
 
     for idx in pinned_indices:
         tab_num = idx + 1
@@ -226,6 +301,8 @@ def open_urls_chrome(
         if pin_result.returncode != 0:
             logger.warning("Could not pin tab {}: {}", tab_num, pin_result.stderr.strip())
 
+    return launch
+
 
 # ----------------------------------------------------------------------------------------------------------------------
 def open_urls_safari(urls: list[str]) -> None:
@@ -256,3 +333,74 @@ def open_urls_default(urls: list[str]) -> None:
     """Open URLs using system default browser."""
     for url in urls:
         subprocess.run([OPEN_BIN, url], check=False)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def open_urls(
+    browser: str,
+    urls: list[str],
+    *,
+    pinned_indices: list[int] | None = None,
+    chrome_profile: str = "",
+    incognito: bool = False,
+) -> ChromeLaunch | None:
+    """Open URLs with a project-style browser setting ("chrome", "safari", anything else = default browser)."""
+    if browser == BROWSER_CHROME:
+        profile = "" if incognito else chrome_profile
+        return open_urls_chrome(urls, pinned_indices or None, profile, incognito=incognito)
+
+    if browser == BROWSER_SAFARI:
+        open_urls_safari(urls)
+        return None
+
+    open_urls_default(urls)
+    return None
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _dispatch_chrome_window(urls: list[str], *, profile_dir: str, incognito: bool) -> str:
+    if is_chrome_running():
+        if profile_dir:
+            # Chrome's binary hands the URLs to the running process over its singleton socket and exits. It is
+            # started detached: if no running Chrome picks the URLs up, it keeps running as the browser itself.
+            try:
+                process = subprocess.Popen(
+                    [get_chrome_bin(), f"--profile-directory={profile_dir}", "--new-window", *urls],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
+            except OSError as e:
+                logger.warning("Could not run Chrome binary {}: {}", get_chrome_bin(), e)
+            else:
+                try:
+                    returncode = process.wait(timeout=CHROME_HANDOFF_TIMEOUT_SECONDS)
+                except subprocess.TimeoutExpired:
+                    # Nothing took the hand-off; the new process opened the window itself
+                    return LAUNCH_BINARY_COLD_START
+                if returncode == 0:
+                    return LAUNCH_PROFILE_PROCESS
+                logger.warning("Chrome binary hand-off failed with exit code {}", returncode)
+        else:
+            result = subprocess.run(
+                [OSASCRIPT_BIN, "-l", "JavaScript", "-e", CHROME_NEW_WINDOW_SCRIPT, "1" if incognito else "0", *urls],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            if result.returncode == 0:
+                return LAUNCH_OSASCRIPT
+            logger.warning("Chrome osascript window failed: {}", result.stderr.strip())
+
+    cmd = [OPEN_BIN, "-na", CHROME_APP_NAME, "--args"]
+    if incognito:
+        cmd.append("--incognito")
+    elif profile_dir:
+        cmd.append(f"--profile-directory={profile_dir}")
+
+    cmd.append("--new-window")
+    cmd.extend(urls)
+
+    subprocess.run(cmd, check=False)
+    return LAUNCH_COLD_START
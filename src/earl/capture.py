@@ -5,14 +5,11 @@ from urllib.parse import urlparse
 
 from loguru import logger
 
-from earl.browsers import BrowserTab
+from earl.browsers import BROWSER_CHROME, BROWSER_SAFARI, BrowserTab
 
 DEFAULT_PROJECT_FILE_NAME = ".earl.toml"
 CHROME_PROFILE_PLACEHOLDER = "CHROME_PROFILE_HERE"
 
-BROWSER_CHROME = "chrome"
-BROWSER_SAFARI = "safari"
-
 TABITHA_PINNED_URL_PREFIX = "https://tabitha.smallblocksoftware.com/"
 
 VALID_URL_SCHEMES = {"http", "https"}
@@ -27,6 +24,48 @@ class ProjectUrl:
     pinned: bool
 
 
+# =====================================================================================================================
+@dataclass(frozen=True, slots=True)
+class ProjectConfig:
+    browser: str
+    chrome_profile: str
+    urls: list[ProjectUrl]
+    malformed: list[object]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def parse_project(data: dict) -> ProjectConfig:
+    """
+    Parse loaded `.earl.toml` data.
+
+    Raises:
+        ValueError: If there is no [[urls]] array
+    """
+    urls_section = data.get("urls")
+    if not isinstance(urls_section, list):
+        raise ValueError(".earl.toml must contain [[urls]] array")
+
+    options = data.get("options", {})
+    if not isinstance(options, dict):
+        options = {}
+
+    urls: list[ProjectUrl] = []
+    malformed: list[object] = []
+
+    for entry in urls_section:
+        if not isinstance(entry, dict) or "name" not in entry or "url" not in entry:
+            malformed.append(entry)
+            continue
+        urls.append(ProjectUrl(name=str(entry["name"]), url=str(entry["url"]), pinned=bool(entry.get("pinned", False))))
+
+    return ProjectConfig(
+        browser=str(options.get("browser", "default")).lower(),
+        chrome_profile=str(options.get("chrome_profile", "")),
+        urls=urls,
+        malformed=malformed,
+    )
+
+
 # ----------------------------------------------------------------------------------------------------------------------
 def build_project_urls_from_tabs(tabs: list[BrowserTab]) -> list[ProjectUrl]:
     """Convert browser tabs -> ProjectUrl list (deduped names, ignores non-http(s) URLs)."""
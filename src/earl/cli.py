@@ -1,29 +1,75 @@
+import json
 import subprocess
+import time
+from functools import partial
 from pathlib import Path
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
+from earl import store
+from earl.bookmarks import DEFAULT_GROUP_PREFIX, get_bookmarks_file, import_chrome_bookmarks
 from earl.browsers import (
+    DEFAULT_PROFILE_DIR,
     get_chrome_front_window_tabs,
     get_chrome_profiles,
     get_safari_front_window_tabs,
+    open_urls,
     open_urls_chrome,
     open_urls_default,
     open_urls_safari,
+    resolve_chrome_profile,
 )
 from earl.capture import (
     CHROME_PROFILE_PLACEHOLDER,
     DEFAULT_PROJECT_FILE_NAME,
+    ProjectUrl,
     build_project_urls_from_tabs,
+    parse_project,
     render_project_toml,
     write_project_file,
 )
-from earl.config import find_project_file, flatten_groups, get_group_urls, get_urls_file, load_toml
+from earl.config import (
+    find_project_file,
+    flatten_groups,
+    get_group_urls,
+    get_store_file,
+    get_urls_file,
+    iter_url_rows,
+    load_toml,
+    match_groups,
+)
+from earl.enrich import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_MAX_BYTES,
+    DEFAULT_TTL_SECONDS,
+    get_titles,
+    needs_title,
+    rename_group_urls,
+    rename_project_urls,
+)
+from earl.fuzzy import DEFAULT_LIMIT, build_candidates, fuzzy_search
 from earl.fzf import fzf_select
+from earl.history import (
+    Snapshot,
+    diff_snapshots,
+    find_snapshot,
+    list_snapshots,
+    load_snapshot_urls,
+    record_snapshot,
+)
+from earl.scheduler import (
+    DEFAULT_INTERVAL_SECONDS,
+    DEFAULT_MAX_TABS,
+    DEFAULT_MAX_WINDOWS,
+    LaunchJob,
+    run_launches,
+)
+from earl.workspace import DEFAULT_SCAN_WORKERS, load_project_index, scan_projects
 
 OPEN_BIN = "open"
+SYNC_DISCARDED_SHOWN = 20
 
 app = typer.Typer(help="Earl - Your friendly URL launcher", add_completion=False)
 console = Console()
@@ -31,10 +77,14 @@ console = Console()
 chrome_app = typer.Typer(help="Chrome helpers", add_completion=False)
 project_app = typer.Typer(help="Project URL sets (.earl.toml)", add_completion=False)
 capture_app = typer.Typer(help="Capture current browser state", add_completion=False)
+store_app = typer.Typer(help="SQLite URL store for large collections (urls.db)", add_completion=False)
+import_app = typer.Typer(help="Import URLs from other sources", add_completion=False)
 
 app.add_typer(chrome_app, name="chrome")
 app.add_typer(project_app, name="project")
 app.add_typer(capture_app, name="capture")
+app.add_typer(store_app, name="store")
+app.add_typer(import_app, name="import")
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -56,20 +106,32 @@ def browse(group_filter: str | None = typer.Argument(None, help="Filter groups b
 
 # ----------------------------------------------------------------------------------------------------------------------
 def _browse(*, group_filter: str | None) -> None:
-    urls_file = get_urls_file()
-    if not urls_file.exists():
-        console.print(f"[red]Error:[/red] URLs file not found at {urls_file}")
-        raise typer.Exit(1)
+    store_file = get_store_file()
+    if store_file.exists():
+        # Page group names out of the store; only the selected group's URLs are loaded
+        with store.open_store(store_file) as conn:
+            all_groups = list(store.iter_groups(conn, contains=group_filter))
+            if not all_groups:
+                console.print("[yellow]No URL groups found[/yellow]")
+                raise typer.Exit(1)
+
+            selected_group = _select_group(all_groups, group_filter)
+            urls = store.get_group_urls(conn, selected_group)
+    else:
+        urls_file = get_urls_file()
+        if not urls_file.exists():
+            console.print(f"[red]Error:[/red] URLs file not found at {urls_file}")
+            raise typer.Exit(1)
 
-    data = load_toml(urls_file)
-    all_groups = flatten_groups(data)
+        data = load_toml(urls_file)
+        all_groups = flatten_groups(data)
 
-    if not all_groups:
-        console.print("[yellow]No URL groups found[/yellow]")
-        raise typer.Exit(1)
+        if not all_groups:
+            console.print("[yellow]No URL groups found[/yellow]")
+            raise typer.Exit(1)
 
-    selected_group = _select_group(all_groups, group_filter)
-    urls = get_group_urls(data, selected_group)
+        selected_group = _select_group(all_groups, group_filter)
+        urls = get_group_urls(data, selected_group)
 
     if not urls:
         console.print(f"[yellow]No URLs found in group '{selected_group}'[/yellow]")
@@ -83,26 +145,246 @@ def _browse(*, group_filter: str | None) -> None:
     subprocess.run([OPEN_BIN, urls[selected_name]], check=False)
 
 
+# ----------------------------------------------------------------------------------------------------------------------
+@app.command()
+def go(
+    query: list[str] = typer.Argument(..., help="Fuzzy query matched against 'group > name'"),
+    list_only: bool = typer.Option(False, "--list", "-l", help="Print the top matches instead of opening"),
+    limit: int = typer.Option(DEFAULT_LIMIT, "--limit", "-n", min=1, help="Number of matches to print with --list"),
+) -> None:
+    """Non-interactive: open the best fuzzy match (no fzf needed)."""
+    rows = _load_url_rows()
+    candidates = build_candidates([f"{group} > {name}" for group, name, _ in rows])
+    matches = fuzzy_search(candidates, " ".join(query), limit=limit if list_only else 1)
+
+    if not matches:
+        console.print(f"[yellow]No URLs match '{' '.join(query)}'[/yellow]")
+        raise typer.Exit(1)
+
+    if list_only:
+        for match in matches:
+            console.print(f"{match.text}  [dim]{rows[match.index][2]}[/dim]", highlight=False)
+        return
+
+    best = matches[0]
+    console.print(f"[green]Opening:[/green] {best.text}")
+    subprocess.run([OPEN_BIN, rows[best.index][2]], check=False)
+
+
 # ----------------------------------------------------------------------------------------------------------------------
 @app.command(name="open-all")
-def open_all(group: str = typer.Argument(..., help="Group name (e.g. work.aws)")) -> None:
-    """Open all URLs from a global group."""
-    urls_file = get_urls_file()
-    if not urls_file.exists():
-        console.print(f"[red]Error:[/red] URLs file not found at {urls_file}")
+def open_all(
+    selectors: list[str] = typer.Argument(
+        ..., help="Group names or globs (e.g. work.aws, 'work.*'); prefix with re: for a regex"
+    ),
+    browser: str = typer.Option("default", "--browser", "-b", help="Browser: chrome, safari or default"),
+    chrome_profile: str = typer.Option("", "--profile", "-p", help="Chrome profile name or directory"),
+    max_windows: int = typer.Option(DEFAULT_MAX_WINDOWS, "--max-windows", min=1, help="Windows in flight at once"),
+    max_tabs: int = typer.Option(DEFAULT_MAX_TABS, "--max-tabs", min=1, help="Tabs in flight at once"),
+    interval: float = typer.Option(
+        DEFAULT_INTERVAL_SECONDS, "--interval", min=0, help="Seconds between window launches"
+    ),
+) -> None:
+    """Open all URLs from one or more global groups, one window per group."""
+    browser = browser.lower()
+    group_urls = _load_selected_group_urls(selectors)
+
+    if not group_urls:
+        console.print(f"[yellow]No URLs found in groups matching: {' '.join(selectors)}[/yellow]")
         raise typer.Exit(1)
 
-    data = load_toml(urls_file)
-    urls = get_group_urls(data, group)
+    if browser == "chrome":
+        launch = partial(_launch_chrome_window, chrome_profile)
+    elif browser == "safari":
+        # Safari adds tabs to "window 1", so concurrent windows would interleave their tabs
+        launch = open_urls_safari
+        max_windows = 1
+    else:
+        launch = open_urls_default
+
+    jobs: list[LaunchJob] = []
+    for group, urls in group_urls.items():
+        console.print(f"[green]Opening group:[/green] {group} ({len(urls)} URLs)")
+        for name in urls:
+            console.print(f"  Opening: {name}")
+        jobs.append(LaunchJob(label=group, urls=list(urls.values()), launch=launch))
+
+    started = time.monotonic()
+    try:
+        timings = run_launches(jobs, max_windows=max_windows, max_tabs=max_tabs, interval=interval)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
 
-    if not urls:
-        console.print(f"[yellow]No URLs found in group '{group}'[/yellow]")
+    table = Table(title=f"Opened {len(timings)} windows in {time.monotonic() - started:.2f}s")
+    table.add_column("Group", style="cyan")
+    table.add_column("Tabs", justify="right")
+    table.add_column("Waited", justify="right")
+    table.add_column("Launch", justify="right")
+
+    for timing in timings:
+        status = "" if timing.ok else " [red](failed)[/red]"
+        table.add_row(
+            f"{timing.label}{status}", str(timing.tab_count), f"{timing.waited:.2f}s", f"{timing.launch:.2f}s"
+        )
+
+    console.print(table)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@app.command()
+def enrich(
+    project_file: Path | None = typer.Option(None, "--project", help="Enrich a .earl.toml instead of global URLs"),
+    write: bool = typer.Option(False, "--write", "-w", help="Write improved names back"),
+    all_urls: bool = typer.Option(False, "--all", help="Fetch titles for every URL, not just placeholder names"),
+    concurrency: int = typer.Option(
+        DEFAULT_CONCURRENCY, "--concurrency", "-c", min=1, help="Requests in flight at once"
+    ),
+    ttl_hours: float = typer.Option(DEFAULT_TTL_SECONDS / 3600, "--ttl-hours", help="Reuse cached titles this fresh"),
+    max_bytes: int = typer.Option(DEFAULT_MAX_BYTES, "--max-bytes", help="Bytes read per page looking for a title"),
+) -> None:
+    """Fetch page titles to replace placeholder names (raw URLs, bare hosts)."""
+    if project_file:
+        project_file = project_file.expanduser()
+        if not project_file.exists():
+            console.print(f"[red]Error:[/red] Project file not found: {project_file}")
+            raise typer.Exit(1)
+        data = load_toml(project_file)
+        urls_section = data.get("urls")
+        entries = [
+            ("", str(entry["name"]), str(entry["url"]))
+            for entry in (urls_section if isinstance(urls_section, list) else [])
+            if isinstance(entry, dict) and "name" in entry and "url" in entry
+        ]
+    else:
+        entries = _load_url_rows()
+
+    targets = [entry for entry in entries if all_urls or needs_title(entry[1], entry[2])]
+    if not targets:
+        console.print("[green]No placeholder names to enrich[/green]")
+        return
+
+    console.print(f"Fetching titles for {len(targets)} URLs...")
+    titles = get_titles(
+        [url for _, _, url in targets], ttl=ttl_hours * 3600, concurrency=concurrency, max_bytes=max_bytes
+    )
+
+    renames = [(group, name, url, title) for group, name, url in targets if (title := titles[url]) and title != name]
+    if not renames:
+        console.print("[yellow]No better titles found[/yellow]")
+        return
+
+    table = Table()
+    if not project_file:
+        table.add_column("Group", style="cyan")
+    table.add_column("Name")
+    table.add_column("Title", style="green")
+
+    for group, name, _, title in renames:
+        table.add_row(*([group] if not project_file else []), name, title)
+
+    console.print(table)
+
+    if not write:
+        console.print("Run with --write to apply")
+        return
+
+    try:
+        if project_file:
+            count = rename_project_urls(project_file, [(name, url, title) for _, name, url, title in renames])
+            written = project_file
+        else:
+            count = len(renames)
+            written = rename_group_urls([(group, name, title) for group, name, _, title in renames])
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
 
-    console.print(f"[green]Opening all URLs in group:[/green] {group}")
-    for name, url in urls.items():
-        console.print(f"  Opening: {name}")
-        subprocess.run([OPEN_BIN, url], check=False)
+    console.print(f"[green]Renamed:[/green] {count} URLs in {written}")
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@store_app.command(name="import")
+def store_import(
+    source: Path | None = typer.Argument(None, help="urls.toml to import (default: global urls.toml)"),
+) -> None:
+    """Bulk import a urls.toml into the SQLite store, replacing its contents."""
+    toml_path = source.expanduser() if source else get_urls_file()
+    if not toml_path.exists():
+        console.print(f"[red]Error:[/red] URLs file not found at {toml_path}")
+        raise typer.Exit(1)
+
+    store_file = get_store_file()
+    with store.open_store(store_file, create=True) as conn:
+        count = store.import_toml(conn, toml_path)
+
+    console.print(f"[green]Imported:[/green] {count} URLs into {store_file}")
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@store_app.command(name="sync")
+def store_sync(
+    prefer: str = typer.Option(store.PREFER_TOML, "--prefer", help="Winner when both sides changed: 'toml' or 'store'"),
+) -> None:
+    """Two-way sync between the SQLite store and the global urls.toml."""
+    store_file = get_store_file()
+    if not store_file.exists():
+        console.print(f"[red]Error:[/red] Store not found at {store_file}. Run `earl store import` first")
+        raise typer.Exit(1)
+
+    try:
+        with store.open_store(store_file, create=True) as conn:
+            result = store.sync_toml(conn, get_urls_file(), prefer=prefer)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    if result.conflict:
+        kept, dropped = ("urls.toml", "store") if result.direction == "import" else ("store", "urls.toml")
+        console.print(
+            f"[yellow]Warning:[/yellow] Both urls.toml and the store changed since the last sync. Kept the {kept} "
+            f"(--prefer {prefer}) and discarded {len(result.discarded)} {dropped} entries:"
+        )
+        for group, name, url in result.discarded[:SYNC_DISCARDED_SHOWN]:
+            console.print(f"  {group} > {name}  [dim]{url}[/dim]", highlight=False)
+        if len(result.discarded) > SYNC_DISCARDED_SHOWN:
+            console.print(f"  ... and {len(result.discarded) - SYNC_DISCARDED_SHOWN} more")
+
+    if result.direction == "import":
+        console.print(f"[green]Imported:[/green] {result.url_count} URLs from urls.toml")
+    elif result.direction == "export":
+        console.print(f"[green]Exported:[/green] {result.url_count} URLs to urls.toml")
+    else:
+        console.print(f"[green]Already in sync[/green] ({result.url_count} URLs)")
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@import_app.command(name="chrome-bookmarks")
+def import_chrome_bookmarks_command(
+    chrome_profile: str = typer.Option(DEFAULT_PROFILE_DIR, "--profile", "-p", help="Chrome profile name or directory"),
+    prefix: str = typer.Option(DEFAULT_GROUP_PREFIX, "--prefix", help="Group prefix for imported folders"),
+    force: bool = typer.Option(False, "--force", help="Re-import everything even if unchanged"),
+) -> None:
+    """Import Chrome bookmarks as dot-groups (incremental; skipped when unchanged)."""
+    profile_dir = resolve_chrome_profile(chrome_profile)
+
+    try:
+        result = import_chrome_bookmarks(profile_dir, prefix=prefix, force=force)
+    except FileNotFoundError:
+        console.print(f"[red]Error:[/red] Bookmarks file not found: {get_bookmarks_file(profile_dir)}")
+        raise typer.Exit(1)
+    except json.JSONDecodeError as e:
+        console.print(f"[red]Error:[/red] Could not read {get_bookmarks_file(profile_dir)}: {e}")
+        raise typer.Exit(1)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}. Import into the store instead (`earl store import` first)")
+        raise typer.Exit(1)
+
+    if result.skipped:
+        console.print(f"[green]Bookmarks unchanged[/green] since last import ({profile_dir})")
+        return
+
+    console.print(f"[green]Imported bookmarks:[/green] +{result.added} -{result.removed} into {result.target}")
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -142,46 +424,59 @@ def project_open(
         console.print(f"[red]Error:[/red] Project file not found: {resolved_project_file}")
         raise typer.Exit(1)
 
-    console.print(f"[green]Opening URLs from:[/green] {resolved_project_file}")
-    data = load_toml(resolved_project_file)
+    _open_project_file(resolved_project_file, incognito=incognito)
+
 
-    urls_section = data.get("urls")
-    if not isinstance(urls_section, list):
-        console.print("[red]Error:[/red] .earl.toml must contain [[urls]] array")
+# ----------------------------------------------------------------------------------------------------------------------
+@project_app.command(name="scan")
+def project_scan(
+    root: Path = typer.Argument(..., help="Directory to search for .earl.toml files"),
+    workers: int = typer.Option(DEFAULT_SCAN_WORKERS, "--workers", "-w", min=1, help="Parallel directory scanners"),
+    exclude: list[str] = typer.Option([], "--exclude", "-x", help="Extra directory names to skip (repeatable)"),
+) -> None:
+    """Index every `.earl.toml` under a root (incremental; for `earl project pick`)."""
+    resolved_root = root.expanduser()
+    if not resolved_root.is_dir():
+        console.print(f"[red]Error:[/red] Not a directory: {resolved_root}")
         raise typer.Exit(1)
 
-    options = data.get("options", {})
-    if not isinstance(options, dict):
-        options = {}
+    started = time.monotonic()
+    result = scan_projects(resolved_root, workers=workers, exclude=frozenset(exclude))
 
-    browser = str(options.get("browser", "default")).lower()
-    chrome_profile = str(options.get("chrome_profile", ""))
+    console.print(
+        f"[green]Indexed {len(result.entries)} projects[/green] in {time.monotonic() - started:.2f}s "
+        f"(+{result.added} added, {result.updated} updated, -{result.removed} removed, {result.unchanged} unchanged)"
+    )
 
-    urls_to_open: list[str] = []
-    pinned_indices: list[int] = []
 
-    for entry in urls_section:
-        if not isinstance(entry, dict) or "name" not in entry or "url" not in entry:
-            console.print(f"[yellow]Warning:[/yellow] Skipping malformed entry: {entry}")
-            continue
+# ----------------------------------------------------------------------------------------------------------------------
+@project_app.command(name="pick")
+def project_pick(
+    incognito: bool = typer.Option(False, "--incognito", "-i", help="Open in Chrome incognito mode"),
+) -> None:
+    """Pick an indexed project with fzf and open its URLs (no cd needed)."""
+    entries = load_project_index()
+    if not entries:
+        console.print("[yellow]No indexed projects. Run `earl project scan <root>` first[/yellow]")
+        raise typer.Exit(1)
 
-        name = entry["name"]
-        url = entry["url"]
-        is_pinned = entry.get("pinned", False)
+    home = Path.home()
+    display_to_path: dict[str, Path] = {}
+    for entry in entries:
+        project_dir = Path(entry.path).parent
+        display_dir = Path("~") / project_dir.relative_to(home) if project_dir.is_relative_to(home) else project_dir
+        display_to_path[f"{display_dir} ({entry.url_count} URLs)"] = Path(entry.path)
 
-        console.print(f"  Opening: {name}" + (" (pinned)" if is_pinned else ""))
-        urls_to_open.append(str(url))
+    selected = fzf_select(list(display_to_path), "Project > ", "Select project to open (ESC to cancel)")
+    if not selected:
+        raise typer.Exit(0)
 
-        if is_pinned:
-            pinned_indices.append(len(urls_to_open) - 1)
+    project_file = display_to_path[selected]
+    if not project_file.exists():
+        console.print(f"[red]Error:[/red] Project file not found: {project_file}. Re-run `earl project scan`")
+        raise typer.Exit(1)
 
-    _open_project_urls(
-        browser=browser,
-        chrome_profile=chrome_profile,
-        urls_to_open=urls_to_open,
-        pinned_indices=pinned_indices,
-        incognito=incognito,
-    )
+    _open_project_file(project_file, incognito=incognito)
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -223,6 +518,12 @@ def capture_chrome(
             chrome_profile, chrome_profile_dir_hint = selected_profile
 
     out_path = output.expanduser() if output else (Path.cwd() / DEFAULT_PROJECT_FILE_NAME)
+    _record_capture(
+        browser="chrome",
+        chrome_profile=None if chrome_profile == CHROME_PROFILE_PLACEHOLDER else chrome_profile,
+        out_path=out_path,
+        urls=urls,
+    )
 
     if out_path.exists() and not overwrite:
         overwrite = typer.confirm(f"{out_path} exists. Overwrite?", default=False)
@@ -266,6 +567,7 @@ def capture_safari(
         raise typer.Exit(1)
 
     out_path = output.expanduser() if output else (Path.cwd() / DEFAULT_PROJECT_FILE_NAME)
+    _record_capture(browser="safari", chrome_profile=None, out_path=out_path, urls=urls)
 
     if out_path.exists() and not overwrite:
         overwrite = typer.confirm(f"{out_path} exists. Overwrite?", default=False)
@@ -283,6 +585,82 @@ def capture_safari(
     console.print(f"[green]Wrote:[/green] {out_path}")
 
 
+# ----------------------------------------------------------------------------------------------------------------------
+@capture_app.command(name="history")
+def capture_history(
+    project_file: Path | None = typer.Option(None, "--project", help="Only snapshots captured to this file"),
+    limit: int = typer.Option(20, "--limit", "-n", help="Number of snapshots to show"),
+) -> None:
+    """List capture snapshots, newest first."""
+    snapshots = list_snapshots(project_file.expanduser().resolve() if project_file else None)
+    if not snapshots:
+        console.print("[yellow]No capture snapshots yet[/yellow]")
+        raise typer.Exit(1)
+
+    table = Table()
+    table.add_column("Snapshot", style="cyan")
+    table.add_column("Captured")
+    table.add_column("Browser")
+    table.add_column("Tabs", justify="right")
+    table.add_column("Project", style="green")
+
+    for snapshot in snapshots[:limit]:
+        table.add_row(snapshot.id, snapshot.created_at, snapshot.browser, str(len(snapshot.entries)), snapshot.project)
+
+    console.print(table)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@capture_app.command(name="diff")
+def capture_diff(
+    old_id: str = typer.Argument(..., help="Older snapshot id (or unique prefix)"),
+    new_id: str | None = typer.Argument(None, help="Newer snapshot id (default: latest)"),
+) -> None:
+    """Show tabs added and removed between two snapshots."""
+    old = _find_snapshot(old_id)
+    if new_id:
+        new = _find_snapshot(new_id)
+    else:
+        new = list_snapshots()[0]
+        if new.id == old.id:
+            console.print(f"[yellow]{old.id} is already the newest snapshot;[/yellow] pass a second id to compare")
+            return
+
+    diff = diff_snapshots(old, new)
+    console.print(f"[cyan]{old.id}[/cyan] -> [cyan]{new.id}[/cyan]")
+
+    for url in diff.removed:
+        console.print(f"[red]- {url.name}[/red]  [dim]{url.url}[/dim]", highlight=False)
+    for url in diff.added:
+        console.print(f"[green]+ {url.name}[/green]  [dim]{url.url}[/dim]", highlight=False)
+
+    if not diff.added and not diff.removed:
+        console.print("No differences")
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@capture_app.command(name="restore")
+def capture_restore(
+    snapshot_id: str = typer.Argument(..., help="Snapshot id (or unique prefix)"),
+    incognito: bool = typer.Option(False, "--incognito", "-i", help="Open in Chrome incognito mode"),
+) -> None:
+    """Reopen the tabs from a capture snapshot."""
+    snapshot = _find_snapshot(snapshot_id)
+    urls = load_snapshot_urls(snapshot)
+
+    console.print(f"[green]Restoring snapshot:[/green] {snapshot.id} ({snapshot.created_at})")
+    for url in urls:
+        console.print(f"  Opening: {url.name}" + (" (pinned)" if url.pinned else ""))
+
+    _open_project_urls(
+        browser=snapshot.browser,
+        chrome_profile=snapshot.chrome_profile or "",
+        urls_to_open=[url.url for url in urls],
+        pinned_indices=[idx for idx, url in enumerate(urls) if url.pinned],
+        incognito=incognito,
+    )
+
+
 # ----------------------------------------------------------------------------------------------------------------------
 def _select_group(all_groups: list[str], group_filter: str | None) -> str:
     if group_filter:
@@ -305,6 +683,49 @@ def _select_group(all_groups: list[str], group_filter: str | None) -> str:
     return selected
 
 
+# ----------------------------------------------------------------------------------------------------------------------
+def _load_url_rows() -> list[tuple[str, str, str]]:
+    store_file = get_store_file()
+    if store_file.exists():
+        with store.open_store(store_file) as conn:
+            return list(store.iter_urls(conn))
+
+    urls_file = get_urls_file()
+    if not urls_file.exists():
+        console.print(f"[red]Error:[/red] URLs file not found at {urls_file}")
+        raise typer.Exit(1)
+
+    return list(iter_url_rows(load_toml(urls_file)))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _load_selected_group_urls(selectors: list[str]) -> dict[str, dict[str, str]]:
+    store_file = get_store_file()
+    try:
+        if store_file.exists():
+            with store.open_store(store_file) as conn:
+                groups = match_groups(store.flatten_groups(conn), selectors)
+                return {group: urls for group in groups if (urls := store.get_group_urls(conn, group))}
+
+        urls_file = get_urls_file()
+        if not urls_file.exists():
+            console.print(f"[red]Error:[/red] URLs file not found at {urls_file}")
+            raise typer.Exit(1)
+
+        data = load_toml(urls_file)
+        groups = match_groups(flatten_groups(data), selectors)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    return {group: urls for group in groups if (urls := get_group_urls(data, group))}
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _launch_chrome_window(chrome_profile: str, urls: list[str]) -> None:
+    open_urls_chrome(urls, profile=chrome_profile)
+
+
 # ----------------------------------------------------------------------------------------------------------------------
 def _select_chrome_profile() -> tuple[str, str] | None:
     profiles = get_chrome_profiles()
@@ -330,6 +751,49 @@ def _select_chrome_profile() -> tuple[str, str] | None:
     return display_to_profile.get(selected)
 
 
+# ----------------------------------------------------------------------------------------------------------------------
+def _record_capture(*, browser: str, chrome_profile: str | None, out_path: Path, urls: list[ProjectUrl]) -> None:
+    snapshot = record_snapshot(browser=browser, chrome_profile=chrome_profile, project=out_path.resolve(), urls=urls)
+    console.print(f"[green]Snapshot:[/green] {snapshot.id}")
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _find_snapshot(snapshot_id: str) -> Snapshot:
+    try:
+        return find_snapshot(snapshot_id)
+    except KeyError:
+        console.print(f"[red]Error:[/red] No snapshot matching '{snapshot_id}'")
+        raise typer.Exit(1)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _open_project_file(project_file: Path, *, incognito: bool) -> None:
+    console.print(f"[green]Opening URLs from:[/green] {project_file}")
+
+    try:
+        project = parse_project(load_toml(project_file))
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    for entry in project.malformed:
+        console.print(f"[yellow]Warning:[/yellow] Skipping malformed entry: {entry}")
+
+    for url in project.urls:
+        console.print(f"  Opening: {url.name}" + (" (pinned)" if url.pinned else ""))
+
+    _open_project_urls(
+        browser=project.browser,
+        chrome_profile=project.chrome_profile,
+        urls_to_open=[url.url for url in project.urls],
+        pinned_indices=[idx for idx, url in enumerate(project.urls) if url.pinned],
+        incognito=incognito,
+    )
+
+
 # ----------------------------------------------------------------------------------------------------------------------
 def _open_project_urls(
     *,
@@ -343,18 +807,18 @@ def _open_project_urls(
         console.print("[yellow]No URLs found[/yellow]")
         raise typer.Exit(1)
 
-    if browser == "chrome":
-        profile = "" if incognito else chrome_profile
-        open_urls_chrome(urls_to_open, pinned_indices if pinned_indices else None, profile, incognito=incognito)
-        return
-
-    if browser == "safari":
-        open_urls_safari(urls_to_open)
-        if pinned_indices:
-            console.print("[yellow]Note:[/yellow] Safari does not support programmatic tab pinning")
-        return
+    launch = open_urls(
+        browser,
+        urls_to_open,
+        pinned_indices=pinned_indices,
+        chrome_profile=chrome_profile,
+        incognito=incognito,
+    )
 
-    open_urls_default(urls_to_open)
+    if launch:
+        console.print(f"[dim]Chrome window via {launch.method} in {launch.seconds:.2f}s[/dim]")
+    if browser == "safari" and pinned_indices:
+        console.print("[yellow]Note:[/yellow] Safari does not support programmatic tab pinning")
 
 
 if __name__ == "__main__":
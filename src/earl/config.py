@@ -1,7 +1,17 @@
+import copy
 import os
+import re
 import tomllib
+from collections.abc import Iterable, Iterator
+from fnmatch import fnmatchcase
 from pathlib import Path
 
+REGEX_SELECTOR_PREFIX = "re:"
+BARE_KEY_RE = re.compile(r"^[A-Za-z0-9_-]+$")
+KEY_VALUE_LINE_RE = re.compile(
+    r"""^(?P<indent>\s*)(?P<key>[A-Za-z0-9_-]+|"(?:[^"\\]|\\.)*"|'[^']*')(?P<rest>\s*=\s*(?P<value>.*?)\s*(?:\n)?)$"""
+)
+
 
 # ----------------------------------------------------------------------------------------------------------------------
 def get_urls_file() -> Path:
@@ -21,9 +31,43 @@ def get_urls_file() -> Path:
 
 
 # ----------------------------------------------------------------------------------------------------------------------
-def find_project_file() -> Path | None:
-    """Search for .earl.toml in current directory or parents."""
-    current = Path.cwd()
+def get_store_file() -> Path:
+    """
+    Get path to the optional SQLite URL store.
+
+    Lives next to urls.toml; when it exists it takes precedence over the TOML file.
+    """
+    return get_urls_file().with_name("urls.db")
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def get_bookmarks_state_file() -> Path:
+    """Get path to the Chrome bookmarks import state (checksums and imported nodes per profile)."""
+    return get_urls_file().with_name("chrome-bookmarks.json")
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def get_project_index_file() -> Path:
+    """Get path to the index of scanned `.earl.toml` project files."""
+    return get_urls_file().with_name("projects.json")
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def get_titles_cache_file() -> Path:
+    """Get path to the page title cache used by `earl enrich`."""
+    return get_urls_file().with_name("titles.json")
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def get_history_dir() -> Path:
+    """Get path to the capture history store (snapshots + content-addressed URL entries)."""
+    return get_urls_file().with_name("history")
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def find_project_file(start: Path | None = None) -> Path | None:
+    """Search for .earl.toml in `start` (default: current directory) or parents."""
+    current = start or Path.cwd()
 
     while current != current.parent:
         project_file = current / ".earl.toml"
@@ -63,9 +107,172 @@ def flatten_groups(data: dict, prefix: str = "") -> list[str]:
             # This is a group with URLs
             result.append(full_key)
 
+            # URL groups may also hold subgroups (e.g. bookmark folders with links and subfolders)
+            if isinstance(value, dict):
+                result.extend(flatten_groups({k: v for k, v in value.items() if isinstance(v, dict)}, full_key))
+
     return sorted(result)
 
 
+# ----------------------------------------------------------------------------------------------------------------------
+def iter_url_rows(data: dict, prefix: str = "") -> Iterator[tuple[str, str, str]]:
+    """Yield (group_path, name, url) for every URL, using the same grouping rules as `flatten_groups`."""
+    for key, value in data.items():
+        if not isinstance(value, dict):
+            continue
+
+        full_key = f"{prefix}.{key}" if prefix else key
+
+        for name, url in value.items():
+            if isinstance(url, str):
+                yield full_key, name, url
+
+        yield from iter_url_rows(value, full_key)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def get_subgroup_keys(group_paths: Iterable[str]) -> dict[str, set[str]]:
+    """Parent group path -> keys of its direct subgroups, over every path and its ancestors."""
+    subgroups: dict[str, set[str]] = {}
+    for group_path in group_paths:
+        parts = group_path.split(".")
+        for depth in range(1, len(parts)):
+            subgroups.setdefault(".".join(parts[:depth]), set()).add(parts[depth])
+    return subgroups
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def render_urls_toml(rows: Iterable[tuple[str, str, str]]) -> str:
+    """
+    Render (group_path, name, url) rows, grouped by path, as urls.toml contents.
+
+    Raises:
+        ValueError: If a URL name is also the key of a subgroup (TOML cannot hold both)
+    """
+    rows = list(rows)
+    subgroups = get_subgroup_keys({group_path for group_path, _, _ in rows})
+    for group_path, name, _ in rows:
+        if name in subgroups.get(group_path, ()):
+            raise ValueError(f"'{name}' in [{group_path}] is both a URL and a subgroup; rename one of them")
+
+    lines: list[str] = []
+    current_group: str | None = None
+
+    for group_path, name, url in rows:
+        if group_path != current_group:
+            if current_group is not None:
+                lines.append("")
+            header = ".".join(_toml_key(part) for part in group_path.split("."))
+            lines.append(f"[{header}]")
+            current_group = group_path
+
+        lines.append(f"{_toml_key(name)} = {quote_toml_string(url)}")
+
+    lines.append("")
+    return "\n".join(lines)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def update_urls_toml(
+    path: Path,
+    *,
+    removed: Iterable[tuple[str, str]] = (),
+    renamed: Iterable[tuple[str, str, str]] = (),
+    added: Iterable[tuple[str, str, str]] = (),
+) -> None:
+    """
+    Edit urls.toml in place, keeping comments, layout and non-URL keys.
+
+    Only the affected `name = "url"` lines change: (group_path, name) entries are deleted, (group_path, old, new)
+    entries renamed, and (group_path, name, url) rows inserted at the end of their group's table (new groups are
+    appended as new tables).
+
+    Raises:
+        ValueError: If the edit cannot be made line by line (e.g. dotted keys or inline tables hold the group);
+            nothing is written
+    """
+    removed = list(removed)
+    renamed = list(renamed)
+    added = list(added)
+
+    text = path.read_text(encoding="utf-8") if path.exists() else ""
+    data = tomllib.loads(text)
+
+    drop = set(removed)
+    new_names = {(group_path, old): new for group_path, old, new in renamed}
+    lines = text.splitlines(keepends=True)
+    if lines and not lines[-1].endswith("\n"):
+        lines[-1] += "\n"
+
+    output: list[list[str]] = [[line] for line in lines]
+    section_end: dict[str, int] = {}
+    section: str | None = ""
+
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped.startswith("["):
+            section = None if stripped.startswith("[[") else _table_path(stripped)
+            if section is not None:
+                section_end.setdefault(section, index)
+            continue
+
+        match = KEY_VALUE_LINE_RE.match(line)
+        if section is None or not match:
+            continue
+
+        name = _parse_key(match["key"])
+        if name is None or not isinstance(_parse_value(match["value"]), str):
+            continue
+
+        section_end[section] = index
+        if (section, name) in drop:
+            output[index] = []
+        elif (section, name) in new_names:
+            output[index] = [f"{match['indent']}{_toml_key(new_names[section, name])}{match['rest']}"]
+
+    appended: dict[str, list[str]] = {}
+    for group_path, name, url in added:
+        entry_line = f"{_toml_key(name)} = {quote_toml_string(url)}\n"
+        if group_path in section_end:
+            output[section_end[group_path]].append(entry_line)
+        else:
+            appended.setdefault(group_path, []).append(entry_line)
+
+    new_lines = [line for chunk in output for line in chunk]
+    for group_path, entry_lines in appended.items():
+        if new_lines and new_lines[-1].strip():
+            new_lines.append("\n")
+        header = ".".join(_toml_key(part) for part in group_path.split("."))
+        new_lines.extend([f"[{header}]\n", *entry_lines])
+    new_text = "".join(new_lines)
+
+    # Refuse to write anything but the intended changes
+    expected = copy.deepcopy(data)
+    for group_path, name in removed:
+        group = _find_group(expected, group_path)
+        if group is not None and isinstance(group.get(name), str):
+            del group[name]
+    for group_path, old, new in renamed:
+        group = _find_group(expected, group_path)
+        if group is not None and isinstance(group.get(old), str):
+            group[new] = group.pop(old)
+    for group_path, name, url in added:
+        group = expected
+        for key in group_path.split("."):
+            group = group.setdefault(key, {})
+        group[name] = url
+
+    try:
+        matches = tomllib.loads(new_text) == expected
+    except tomllib.TOMLDecodeError:
+        matches = False
+    if not matches:
+        raise ValueError(f"Cannot edit {path} line by line; its layout is too unusual to change safely")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(new_text, encoding="utf-8")
+
+
 # ----------------------------------------------------------------------------------------------------------------------
 def get_group_urls(data: dict, group_path: str) -> dict[str, str]:
     """
@@ -92,3 +299,85 @@ def get_group_urls(data: dict, group_path: str) -> dict[str, str]:
         return {name: url for name, url in value.items() if isinstance(url, str)}
 
     return {}
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def match_groups(groups: list[str], selectors: list[str]) -> list[str]:
+    """
+    Resolve group selectors against a flattened group list.
+
+    Selectors are exact paths or globs ("work.*", "oncall.dash*"); prefix with "re:" for a regex
+    searched within the path ("re:^(work|oncall)\\."). Results keep selector order, then
+    group order, without duplicates.
+
+    Raises:
+        ValueError: If a regex selector is invalid
+    """
+    result: dict[str, None] = {}
+
+    for selector in selectors:
+        if selector.startswith(REGEX_SELECTOR_PREFIX):
+            pattern = selector.removeprefix(REGEX_SELECTOR_PREFIX)
+            try:
+                regex = re.compile(pattern)
+            except re.error as e:
+                raise ValueError(f"Invalid group regex '{pattern}': {e}") from e
+            matched = [group for group in groups if regex.search(group)]
+        else:
+            matched = [group for group in groups if fnmatchcase(group, selector)]
+
+        result.update(dict.fromkeys(matched))
+
+    return list(result)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def quote_toml_string(value: str) -> str:
+    """Quote `value` as a TOML basic string."""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n").replace("\t", "\\t")
+    return f'"{escaped}"'
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _toml_key(value: str) -> str:
+    return value if BARE_KEY_RE.match(value) else quote_toml_string(value)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _table_path(header_line: str) -> str | None:
+    # Let tomllib decode quoted and dotted header keys
+    try:
+        value = tomllib.loads(f"{header_line}\n")
+    except tomllib.TOMLDecodeError:
+        return None
+
+    parts: list[str] = []
+    while isinstance(value, dict) and len(value) == 1:
+        key, value = next(iter(value.items()))
+        parts.append(key)
+    return ".".join(parts) if parts else None
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _parse_key(key: str) -> str | None:
+    try:
+        parsed = tomllib.loads(f"{key} = 0\n")
+    except tomllib.TOMLDecodeError:
+        return None
+    return next(iter(parsed))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _parse_value(value: str) -> object:
+    try:
+        return tomllib.loads(f"value = {value}\n")["value"]
+    except tomllib.TOMLDecodeError:
+        return None
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _find_group(data: dict, group_path: str) -> dict | None:
+    value: object = data
+    for key in group_path.split("."):
+        value = value.get(key) if isinstance(value, dict) else None
+    return value if isinstance(value, dict) else None
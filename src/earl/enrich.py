@@ -0,0 +1,348 @@
+import asyncio
+import codecs
+import json
+import re
+import time
+import tomllib
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import urlparse
+
+from loguru import logger
+
+from earl import __version__, store
+from earl.capture import VALID_URL_SCHEMES
+from earl.config import (
+    get_store_file,
+    get_subgroup_keys,
+    get_titles_cache_file,
+    get_urls_file,
+    load_toml,
+    quote_toml_string,
+    update_urls_toml,
+)
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_MAX_BYTES = 32 * 1024
+DEFAULT_TIMEOUT_SECONDS = 10.0
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+
+READ_CHUNK_BYTES = 2048
+MAX_TITLE_LENGTH = 120
+
+USER_AGENT = f"earl/{__version__} (title enrichment)"
+
+WHITESPACE_RE = re.compile(r"\s+")
+DEDUPE_SUFFIX_RE = re.compile(r" \(\d+\)$")
+
+TABLE_HEADER_RE = re.compile(r"^\s*\[")
+URLS_TABLE_HEADER_RE = re.compile(r"^\s*\[\[\s*urls\s*\]\]")
+NAME_LINE_RE = re.compile(r"""^(?P<prefix>\s*name\s*=\s*)(?:"(?:[^"\\\n]|\\.)*"|'[^'\n]*')(?P<rest>.*\n?)$""")
+
+
+# =====================================================================================================================
+@dataclass(frozen=True, slots=True)
+class CachedTitle:
+    title: str | None
+    fetched_at: float
+
+
+# =====================================================================================================================
+class TitleParser(HTMLParser):
+    """Incremental parser for `<title>` and `og:title`; `done` turns True once nothing more is needed."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.title = ""
+        self.og_title = ""
+        self.done = False
+        self._in_title = False
+
+    @property
+    def best_title(self) -> str | None:
+        title = WHITESPACE_RE.sub(" ", self.og_title or self.title).strip()
+        return title[:MAX_TITLE_LENGTH] if title else None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "title":
+            self._in_title = True
+        elif tag == "meta":
+            values = dict(attrs)
+            if (values.get("property") or values.get("name")) == "og:title" and values.get("content"):
+                self.og_title = values["content"] or ""
+                self.done = True
+        elif tag == "body":
+            self.done = True
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "title":
+            self._in_title = False
+        elif tag == "head":
+            self.done = True
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            self.title += data
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def needs_title(name: str, url: str) -> bool:
+    """True if `name` is a placeholder: the URL itself, or the host fallback used by capture."""
+    base = DEDUPE_SUFFIX_RE.sub("", name).strip()
+    parsed = urlparse(url)
+    return not base or base in {url, parsed.netloc} or base.startswith(("http://", "https://"))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def fetch_title(
+    url: str,
+    *,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+) -> str | None:
+    """Fetch `url` and parse its title from at most `max_bytes` of the body (blocking)."""
+    if urlparse(url).scheme not in VALID_URL_SCHEMES:
+        return None
+
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT, "Accept": "text/html"})
+    parser = TitleParser()
+
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        if "html" not in response.headers.get_content_type():
+            return None
+
+        charset = response.headers.get_content_charset() or "utf-8"
+        try:
+            decoder = codecs.getincrementaldecoder(charset)(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        remaining = max_bytes
+        while remaining > 0 and not parser.done:
+            chunk = response.read(min(READ_CHUNK_BYTES, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            parser.feed(decoder.decode(chunk))
+
+    return parser.best_title
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+async def fetch_titles(
+    urls: list[str],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+) -> dict[str, str | None]:
+    """
+    Fetch titles for `urls` with at most `concurrency` requests in flight. Failures map to None.
+
+    Requests run on a thread pool of exactly `concurrency` workers, not the loop's default executor (which is capped
+    at min(32, cpus + 4) threads and would silently lower a larger setting).
+
+    Raises:
+        ValueError: If `concurrency` is less than 1
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+    loop = asyncio.get_running_loop()
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="earl-title") as pool:
+
+        async def fetch(url: str) -> tuple[str, str | None]:
+            request = partial(fetch_title, url, max_bytes=max_bytes, timeout=timeout)
+            try:
+                title = await loop.run_in_executor(pool, request)
+            except Exception as e:
+                logger.debug("No title for {}: {}", url, e)
+                title = None
+            return url, title
+
+        return dict(await asyncio.gather(*(fetch(url) for url in urls)))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def get_titles(
+    urls: list[str],
+    *,
+    ttl: float = DEFAULT_TTL_SECONDS,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+) -> dict[str, str | None]:
+    """
+    Titles for `urls`, served from the title cache when younger than `ttl` and fetched otherwise.
+
+    Failed fetches are cached too (as None) so dead links are not retried until the TTL expires.
+    """
+    cache_file = get_titles_cache_file()
+    cache = load_title_cache(cache_file)
+    now = time.time()
+
+    stale = [url for url in dict.fromkeys(urls) if url not in cache or now - cache[url].fetched_at > ttl]
+    if stale:
+        fetched = asyncio.run(fetch_titles(stale, concurrency=concurrency, max_bytes=max_bytes, timeout=timeout))
+        for url, title in fetched.items():
+            cache[url] = CachedTitle(title=title, fetched_at=now)
+        save_title_cache(cache_file, cache)
+
+    return {url: cache[url].title for url in urls}
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def load_title_cache(path: Path) -> dict[str, CachedTitle]:
+    if not path.exists():
+        return {}
+
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        logger.warning("Ignoring unreadable title cache at {}", path)
+        return {}
+
+    cache: dict[str, CachedTitle] = {}
+    for url, item in raw.items() if isinstance(raw, dict) else []:
+        if isinstance(item, dict) and isinstance(item.get("fetched_at"), int | float):
+            title = item.get("title")
+            cache[url] = CachedTitle(title=title if isinstance(title, str) else None, fetched_at=item["fetched_at"])
+
+    return cache
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def save_title_cache(path: Path, cache: dict[str, CachedTitle]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    raw = {url: {"title": entry.title, "fetched_at": entry.fetched_at} for url, entry in cache.items()}
+    path.write_text(json.dumps(raw, indent=2), encoding="utf-8")
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def rename_group_urls(renames: list[tuple[str, str, str]]) -> Path:
+    """
+    Apply (group_path, old_name, new_name) renames to the URL store (urls.db if present, else urls.toml).
+
+    New names that collide within a group get a " (n)" suffix. Returns the file written.
+
+    Raises:
+        ValueError: If urls.toml cannot be edited line by line (nothing is written)
+    """
+    store_file = get_store_file()
+    if store_file.exists():
+        with store.open_store(store_file) as conn:
+            # New names must not collide with subgroup keys either, or urls.toml could not be exported
+            subgroups = get_subgroup_keys(store.flatten_groups(conn))
+            used: dict[str, set[str]] = {}
+            with conn:
+                for group, old_name, new_name in renames:
+                    names = used.setdefault(group, set(store.get_group_urls(conn, group)) | subgroups.get(group, set()))
+                    name = _unique_name(new_name, names - {old_name})
+                    conn.execute("UPDATE urls SET name = ? WHERE group_path = ? AND name = ?", (name, group, old_name))
+                    names.discard(old_name)
+                    names.add(name)
+        return store_file
+
+    urls_file = get_urls_file()
+    data = load_toml(urls_file)
+    renamed: list[tuple[str, str, str]] = []
+
+    for group, old_name, new_name in renames:
+        value = data
+        for key in group.split("."):
+            value = value.get(key, {}) if isinstance(value, dict) else {}
+        if not isinstance(value, dict) or not isinstance(value.get(old_name), str):
+            continue
+
+        name = _unique_name(new_name, {key for key in value if key != old_name})
+        value[name] = value.pop(old_name)
+        renamed.append((group, old_name, name))
+
+    # Only the renamed key lines change; comments and layout are kept
+    update_urls_toml(urls_file, renamed=renamed)
+    return urls_file
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def rename_project_urls(project_file: Path, renames: list[tuple[str, str, str]]) -> int:
+    """
+    Apply (old_name, url, new_name) renames to a `.earl.toml`. Returns the number of entries renamed.
+
+    Each rename applies to one [[urls]] entry matching both name and URL, so entries that share a placeholder name
+    get their own titles. Only the `name` lines are rewritten; options, comments and other keys are left as is.
+
+    Raises:
+        ValueError: If the names cannot be rewritten in place (e.g. an inline `urls = [...]` array)
+    """
+    text = project_file.read_text(encoding="utf-8")
+    data = tomllib.loads(text)
+
+    urls_section = data.get("urls")
+    entries = urls_section if isinstance(urls_section, list) else []
+    names = {str(entry["name"]) for entry in entries if isinstance(entry, dict) and "name" in entry}
+
+    pending = list(renames)
+    new_names: dict[int, str] = {}
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict) or "name" not in entry or "url" not in entry:
+            continue
+
+        key = (str(entry["name"]), str(entry["url"]))
+        match = next((i for i, (old_name, url, _) in enumerate(pending) if (old_name, url) == key), None)
+        if match is None:
+            continue
+
+        new_name = _unique_name(pending.pop(match)[2], names)
+        names.add(new_name)
+        new_names[index] = new_name
+
+    if not new_names:
+        return 0
+
+    new_text = _replace_project_names(text, new_names)
+
+    # Refuse to write anything but the intended name changes
+    expected = tomllib.loads(text)
+    for index, new_name in new_names.items():
+        expected["urls"][index]["name"] = new_name
+    if tomllib.loads(new_text) != expected:
+        raise ValueError(f"Could not rewrite URL names in {project_file} in place")
+
+    project_file.write_text(new_text, encoding="utf-8")
+    logger.info("Wrote {}", project_file)
+    return len(new_names)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _replace_project_names(text: str, new_names: dict[int, str]) -> str:
+    lines = text.splitlines(keepends=True)
+    table_index = -1
+    in_urls = False
+
+    for i, line in enumerate(lines):
+        if TABLE_HEADER_RE.match(line):
+            in_urls = bool(URLS_TABLE_HEADER_RE.match(line))
+            table_index += in_urls
+            continue
+
+        if in_urls and table_index in new_names and (match := NAME_LINE_RE.match(line)):
+            lines[i] = f"{match['prefix']}{quote_toml_string(new_names[table_index])}{match['rest']}"
+
+    return "".join(lines)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _unique_name(base_name: str, used: set[str]) -> str:
+    name = base_name
+    count = 1
+
+    while name in used:
+        count += 1
+        name = f"{base_name} ({count})"
+
+    return name
@@ -0,0 +1,201 @@
+import heapq
+from dataclasses import dataclass
+
+# Scoring constants from fzf's algo.go (v1 matcher)
+SCORE_MATCH = 16
+SCORE_GAP_START = -3
+SCORE_GAP_EXTENSION = -1
+BONUS_BOUNDARY = SCORE_MATCH // 2
+BONUS_BOUNDARY_WHITE = BONUS_BOUNDARY + 2
+BONUS_BOUNDARY_DELIMITER = BONUS_BOUNDARY + 1
+BONUS_NON_WORD = SCORE_MATCH // 2
+BONUS_CAMEL_123 = BONUS_BOUNDARY + SCORE_GAP_EXTENSION
+BONUS_CONSECUTIVE = -(SCORE_GAP_START + SCORE_GAP_EXTENSION)
+BONUS_FIRST_CHAR_MULTIPLIER = 2
+
+CHAR_WHITE = 0
+CHAR_NON_WORD = 1
+CHAR_DELIMITER = 2
+CHAR_LOWER = 3
+CHAR_UPPER = 4
+CHAR_NUMBER = 5
+
+DELIMITER_CHARS = "/,:;|"
+
+DEFAULT_LIMIT = 10
+
+
+# =====================================================================================================================
+@dataclass(frozen=True, slots=True)
+class FuzzyCandidate:
+    text: str
+    lower: str
+    mask: int
+
+
+# =====================================================================================================================
+@dataclass(frozen=True, slots=True)
+class FuzzyMatch:
+    text: str
+    score: int
+    index: int
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def build_candidates(texts: list[str]) -> list[FuzzyCandidate]:
+    """Precompute lowercase text and character bitmask for each candidate (build once, search many times)."""
+    candidates: list[FuzzyCandidate] = []
+    for text in texts:
+        lower = text.lower()
+        if len(lower) != len(text):
+            # Keep indexes aligned with the original text (e.g. "İ".lower() is two characters)
+            lower = "".join(ch.lower()[:1] for ch in text)
+        candidates.append(FuzzyCandidate(text=text, lower=lower, mask=char_mask(lower)))
+    return candidates
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def char_mask(text: str) -> int:
+    """64-bit mask of the characters in `text`; a candidate can only match if it has every bit of the query."""
+    mask = 0
+    for ch in set(text):
+        mask |= 1 << (ord(ch) & 63)
+    return mask
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def fuzzy_score(candidate: FuzzyCandidate, term: str) -> int | None:
+    """
+    Score one lowercase query term against a candidate the way fzf's v1 algorithm does.
+
+    Finds the first fuzzy occurrence scanning forward, shrinks it scanning backward, then scores the window
+    with fzf's match, gap, boundary and camelCase bonuses.
+
+    Returns:
+        Score, or None if the term does not match
+    """
+    text = candidate.lower
+
+    # Forward scan: where does the first complete occurrence end?
+    pos = -1
+    for ch in term:
+        pos = text.find(ch, pos + 1)
+        if pos < 0:
+            return None
+    end = pos + 1
+
+    # Backward scan: latest start for that end gives the shortest window
+    start = end
+    for ch in reversed(term):
+        start = text.rfind(ch, 0, start)
+
+    return _calculate_score(candidate.text, text, term, start, end)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def fuzzy_search(candidates: list[FuzzyCandidate], query: str, limit: int = DEFAULT_LIMIT) -> list[FuzzyMatch]:
+    """
+    Rank candidates against a query (case-insensitive; space-separated terms must all match).
+
+    Ties go to the shorter candidate, then to the earlier one.
+    """
+    terms = query.lower().split()
+    if not terms:
+        return [FuzzyMatch(text=c.text, score=0, index=i) for i, c in enumerate(candidates[:limit])]
+
+    query_mask = char_mask("".join(terms))
+    scored: list[tuple[int, int, int]] = []
+
+    for index, candidate in enumerate(candidates):
+        if candidate.mask & query_mask != query_mask:
+            continue
+
+        total = 0
+        for term in terms:
+            score = fuzzy_score(candidate, term)
+            if score is None:
+                break
+            total += score
+        else:
+            scored.append((total, -len(candidate.text), -index))
+
+    best = heapq.nlargest(limit, scored)
+    return [FuzzyMatch(text=candidates[-neg_index].text, score=score, index=-neg_index) for score, _, neg_index in best]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _calculate_score(original: str, text: str, term: str, start: int, end: int) -> int:
+    pidx = 0
+    score = 0
+    in_gap = False
+    consecutive = 0
+    first_bonus = 0
+    prev_class = _char_class(original[start - 1]) if start > 0 else CHAR_WHITE
+
+    for idx in range(start, end):
+        char_class = _char_class(original[idx])
+
+        if pidx < len(term) and text[idx] == term[pidx]:
+            score += SCORE_MATCH
+            bonus = _bonus_for(prev_class, char_class)
+
+            if consecutive == 0:
+                first_bonus = bonus
+            else:
+                # Consecutive chunk inherits the bonus of its first character
+                if bonus >= BONUS_BOUNDARY and bonus > first_bonus:
+                    first_bonus = bonus
+                bonus = max(bonus, first_bonus, BONUS_CONSECUTIVE)
+
+            score += bonus * BONUS_FIRST_CHAR_MULTIPLIER if pidx == 0 else bonus
+            in_gap = False
+            consecutive += 1
+            pidx += 1
+        else:
+            score += SCORE_GAP_EXTENSION if in_gap else SCORE_GAP_START
+            in_gap = True
+            consecutive = 0
+            first_bonus = 0
+
+        prev_class = char_class
+
+    return score
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _char_class(ch: str) -> int:
+    if ch.islower():
+        return CHAR_LOWER
+    if ch.isupper():
+        return CHAR_UPPER
+    if ch.isdigit():
+        return CHAR_NUMBER
+    if ch.isspace():
+        return CHAR_WHITE
+    if ch in DELIMITER_CHARS:
+        return CHAR_DELIMITER
+    return CHAR_NON_WORD
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _bonus_for(prev_class: int, char_class: int) -> int:
+    if char_class > CHAR_NON_WORD:
+        # Word or delimiter character right after a boundary
+        if prev_class == CHAR_WHITE:
+            return BONUS_BOUNDARY_WHITE
+        if prev_class == CHAR_DELIMITER:
+            return BONUS_BOUNDARY_DELIMITER
+        if prev_class == CHAR_NON_WORD:
+            return BONUS_BOUNDARY
+
+    if (prev_class == CHAR_LOWER and char_class == CHAR_UPPER) or (
+        prev_class != CHAR_NUMBER and char_class == CHAR_NUMBER
+    ):
+        return BONUS_CAMEL_123
+
+    if char_class == CHAR_NON_WORD or char_class == CHAR_DELIMITER:
+        return BONUS_NON_WORD
+    if char_class == CHAR_WHITE:
+        return BONUS_BOUNDARY_WHITE
+
+    return 0
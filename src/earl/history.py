@@ -0,0 +1,171 @@
+import glob
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+from earl.capture import ProjectUrl
+from earl.config import get_history_dir
+
+OBJECTS_DIR_NAME = "objects"
+SNAPSHOTS_DIR_NAME = "snapshots"
+
+SNAPSHOT_ID_FORMAT = "%Y%m%dT%H%M%SZ"
+SNAPSHOT_ID_HASH_LENGTH = 6
+
+
+# =====================================================================================================================
+@dataclass(frozen=True, slots=True)
+class Snapshot:
+    id: str
+    created_at: str
+    browser: str
+    chrome_profile: str | None
+    project: str
+    entries: list[str]
+
+
+# =====================================================================================================================
+@dataclass(frozen=True, slots=True)
+class SnapshotDiff:
+    added: list[ProjectUrl]
+    removed: list[ProjectUrl]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def record_snapshot(
+    *,
+    browser: str,
+    chrome_profile: str | None,
+    project: Path,
+    urls: list[ProjectUrl],
+) -> Snapshot:
+    """
+    Record a capture as an immutable snapshot.
+
+    Each URL entry is stored once under the hash of its contents; the snapshot only lists entry hashes, so tabs
+    that repeat between captures cost no extra space.
+    """
+    history_dir = get_history_dir()
+    entries = [_write_object(history_dir, url) for url in urls]
+
+    now = datetime.now().astimezone()
+    digest = hashlib.sha256("\n".join(entries).encode("utf-8")).hexdigest()
+    snapshot = Snapshot(
+        # UTC, so ids do not jump back across DST changes or timezone moves
+        id=f"{now.astimezone(UTC).strftime(SNAPSHOT_ID_FORMAT)}-{digest[:SNAPSHOT_ID_HASH_LENGTH]}",
+        created_at=now.isoformat(timespec="seconds"),
+        browser=browser,
+        chrome_profile=chrome_profile,
+        project=str(project),
+        entries=entries,
+    )
+
+    snapshot_path = history_dir / SNAPSHOTS_DIR_NAME / f"{snapshot.id}.json"
+    _write_new_file(snapshot_path, json.dumps(asdict(snapshot), indent=2))
+    return snapshot
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def list_snapshots(project: Path | None = None) -> list[Snapshot]:
+    """All snapshots, newest first, optionally only those captured for `project`."""
+    snapshots_dir = get_history_dir() / SNAPSHOTS_DIR_NAME
+    if not snapshots_dir.exists():
+        return []
+
+    snapshots = [_load_snapshot(path) for path in snapshots_dir.glob("*.json")]
+    snapshots.sort(key=lambda snapshot: (datetime.fromisoformat(snapshot.created_at), snapshot.id), reverse=True)
+    if project is not None:
+        snapshots = [snapshot for snapshot in snapshots if snapshot.project == str(project)]
+    return snapshots
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def find_snapshot(id_prefix: str) -> Snapshot:
+    """
+    Look up a snapshot by id or unique id prefix.
+
+    Raises:
+        KeyError: If no snapshot matches
+        ValueError: If the prefix matches more than one snapshot
+    """
+    snapshots_dir = get_history_dir() / SNAPSHOTS_DIR_NAME
+    matches = sorted(snapshots_dir.glob(f"{glob.escape(id_prefix)}*.json")) if snapshots_dir.exists() else []
+
+    if not matches:
+        raise KeyError(id_prefix)
+    if len(matches) > 1:
+        raise ValueError(f"Snapshot id '{id_prefix}' is ambiguous ({len(matches)} matches)")
+
+    return _load_snapshot(matches[0])
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def load_snapshot_urls(snapshot: Snapshot) -> list[ProjectUrl]:
+    """Resolve a snapshot's entry hashes back to URLs, in captured order."""
+    return _load_objects(get_history_dir(), snapshot.entries)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def diff_snapshots(old: Snapshot, new: Snapshot) -> SnapshotDiff:
+    """Entries present in only one of two snapshots (compared by hash, so renames show as remove + add)."""
+    old_entries = set(old.entries)
+    new_entries = set(new.entries)
+
+    added = [digest for digest in dict.fromkeys(new.entries) if digest not in old_entries]
+    removed = [digest for digest in dict.fromkeys(old.entries) if digest not in new_entries]
+
+    history_dir = get_history_dir()
+    return SnapshotDiff(added=_load_objects(history_dir, added), removed=_load_objects(history_dir, removed))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _write_object(history_dir: Path, url: ProjectUrl) -> str:
+    contents = json.dumps({"name": url.name, "url": url.url, "pinned": url.pinned}, sort_keys=True)
+    digest = hashlib.sha256(contents.encode("utf-8")).hexdigest()
+
+    path = _object_path(history_dir, digest)
+    if not path.exists():
+        _write_new_file(path, contents)
+
+    return digest
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _load_objects(history_dir: Path, digests: list[str]) -> list[ProjectUrl]:
+    urls: list[ProjectUrl] = []
+
+    for digest in digests:
+        raw = json.loads(_object_path(history_dir, digest).read_text(encoding="utf-8"))
+        urls.append(ProjectUrl(name=raw["name"], url=raw["url"], pinned=bool(raw["pinned"])))
+
+    return urls
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _object_path(history_dir: Path, digest: str) -> Path:
+    return history_dir / OBJECTS_DIR_NAME / digest[:2] / f"{digest[2:]}.json"
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _write_new_file(path: Path, contents: str) -> None:
+    # Write to a temp file and rename, so a reader never sees a partial object or snapshot
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(contents, encoding="utf-8")
+    tmp_path.replace(path)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _load_snapshot(path: Path) -> Snapshot:
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    return Snapshot(
+        id=raw["id"],
+        created_at=raw["created_at"],
+        browser=raw["browser"],
+        chrome_profile=raw.get("chrome_profile"),
+        project=raw["project"],
+        entries=list(raw["entries"]),
+    )
@@ -0,0 +1,141 @@
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from loguru import logger
+
+DEFAULT_MAX_WINDOWS = 2
+DEFAULT_MAX_TABS = 20
+DEFAULT_INTERVAL_SECONDS = 0.5
+DEFAULT_SETTLE_SECONDS = 1.0
+
+
+# =====================================================================================================================
+@dataclass(frozen=True, slots=True)
+class LaunchJob:
+    label: str
+    urls: list[str]
+    launch: Callable[[list[str]], None]
+
+
+# =====================================================================================================================
+@dataclass(frozen=True, slots=True)
+class LaunchTiming:
+    label: str
+    tab_count: int
+    waited: float
+    launch: float
+    ok: bool
+
+
+# =====================================================================================================================
+class _TabBudget:
+    """Counting semaphore that can acquire several tabs at once."""
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._available = capacity
+        self._cond = threading.Condition()
+
+    def acquire(self, count: int) -> int:
+        # A window bigger than the whole budget waits for the budget to drain, then takes all of it
+        count = min(count, self._capacity)
+        with self._cond:
+            self._cond.wait_for(lambda: self._available >= count)
+            self._available -= count
+        return count
+
+    def release(self, count: int) -> None:
+        with self._cond:
+            self._available += count
+            self._cond.notify_all()
+
+
+# =====================================================================================================================
+class _Pacer:
+    """Enforce a minimum interval between launch starts across threads."""
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+
+        if start > now:
+            time.sleep(start - now)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def run_launches(
+    jobs: list[LaunchJob],
+    *,
+    max_windows: int = DEFAULT_MAX_WINDOWS,
+    max_tabs: int = DEFAULT_MAX_TABS,
+    interval: float = DEFAULT_INTERVAL_SECONDS,
+    settle: float = DEFAULT_SETTLE_SECONDS,
+) -> list[LaunchTiming]:
+    """
+    Launch one window per job while throttling the browser.
+
+    Args:
+        jobs: Windows to open, in launch order
+        max_windows: Windows allowed in flight at once
+        max_tabs: Tabs allowed in flight at once (across all windows)
+        interval: Minimum seconds between launch starts
+        settle: Seconds a window stays "in flight" after its launch returns, to let pages start loading (skipped
+            when no other job is still waiting to launch)
+
+    Returns:
+        LaunchTiming per job, in job order
+    """
+    if max_windows < 1 or max_tabs < 1:
+        raise ValueError("max_windows and max_tabs must be at least 1")
+
+    budget = _TabBudget(max_tabs)
+    pacer = _Pacer(interval)
+    queued_at = time.monotonic()
+
+    waiting = len(jobs)
+    waiting_lock = threading.Lock()
+
+    def run(job: LaunchJob) -> LaunchTiming:
+        nonlocal waiting
+        held = budget.acquire(len(job.urls))
+        try:
+            pacer.wait()
+            with waiting_lock:
+                waiting -= 1
+            started = time.monotonic()
+            ok = True
+            try:
+                job.launch(job.urls)
+            except Exception as e:
+                logger.warning("Launch failed for {}: {}", job.label, e)
+                ok = False
+            finished = time.monotonic()
+
+            # Settling only protects windows that are still queued
+            with waiting_lock:
+                others_waiting = waiting > 0
+            if settle > 0 and others_waiting:
+                time.sleep(settle)
+        finally:
+            budget.release(held)
+
+        return LaunchTiming(
+            label=job.label,
+            tab_count=len(job.urls),
+            waited=started - queued_at,
+            launch=finished - started,
+            ok=ok,
+        )
+
+    with ThreadPoolExecutor(max_workers=max_windows, thread_name_prefix="earl-launch") as pool:
+        return list(pool.map(run, jobs))
@@ -0,0 +1,291 @@
+import sqlite3
+from collections.abc import Iterable, Iterator
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from loguru import logger
+
+from earl.config import iter_url_rows, load_toml, render_urls_toml
+
+DEFAULT_PAGE_SIZE = 500
+
+PREFER_TOML = "toml"
+PREFER_STORE = "store"
+
+META_REVISION = "revision"
+META_SYNCED_REVISION = "synced_revision"
+META_SYNCED_TOML_MTIME_NS = "synced_toml_mtime_ns"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (
+    group_path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    url TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (group_path, name)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS urls_group_position ON urls (group_path, position);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+) WITHOUT ROWID;
+
+INSERT OR IGNORE INTO meta (key, value) VALUES ('revision', 0), ('synced_revision', 0), ('synced_toml_mtime_ns', 0);
+
+CREATE TRIGGER IF NOT EXISTS urls_insert_revision AFTER INSERT ON urls BEGIN
+    UPDATE meta SET value = value + 1 WHERE key = 'revision';
+END;
+
+CREATE TRIGGER IF NOT EXISTS urls_update_revision AFTER UPDATE ON urls BEGIN
+    UPDATE meta SET value = value + 1 WHERE key = 'revision';
+END;
+
+CREATE TRIGGER IF NOT EXISTS urls_delete_revision AFTER DELETE ON urls BEGIN
+    UPDATE meta SET value = value + 1 WHERE key = 'revision';
+END;
+"""
+
+
+# =====================================================================================================================
+@dataclass(frozen=True, slots=True)
+class SyncResult:
+    direction: str
+    url_count: int
+    # Both sides changed since the last sync; `discarded` holds the losing side's rows the winner does not have
+    conflict: bool = False
+    discarded: list[tuple[str, str, str]] = field(default_factory=list)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@contextmanager
+def open_store(path: Path, *, create: bool = False) -> Iterator[sqlite3.Connection]:
+    """
+    Open the SQLite URL store.
+
+    Without `create` the store must already exist and nothing is written on open, so readers never wait on a
+    writer (WAL readers see the last committed state). With `create` the file and schema are created if needed
+    and WAL mode is enabled; import and sync use this.
+    """
+    if create:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(path)
+    else:
+        conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=rw", uri=True)
+
+    with closing(conn):
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if create:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+        yield conn
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def iter_groups(
+    conn: sqlite3.Connection,
+    prefix: str = "",
+    contains: str | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[str]:
+    """
+    Yield group paths in sorted order, one page at a time.
+
+    Args:
+        conn: Open store connection
+        prefix: Only groups equal to or nested under this dot-path (uses the primary key index)
+        contains: Only groups containing this substring
+        page_size: Rows fetched per query (keyset pagination)
+    """
+    clauses = ["group_path > ?"]
+    params: list[str] = []
+
+    if prefix:
+        # "work" matches "work" and "work.*"; '/' sorts directly after '.'
+        clauses.append("(group_path = ? OR (group_path > ? AND group_path < ?))")
+        params.extend([prefix, f"{prefix}.", f"{prefix}/"])
+
+    if contains:
+        clauses.append("instr(group_path, ?) > 0")
+        params.append(contains)
+
+    sql = f"SELECT DISTINCT group_path FROM urls WHERE {' AND '.join(clauses)} ORDER BY group_path LIMIT ?"
+    last = ""
+
+    while True:
+        rows = conn.execute(sql, [last, *params, page_size]).fetchall()
+        for (group_path,) in rows:
+            yield group_path
+
+        if len(rows) < page_size:
+            return
+        last = rows[-1][0]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def flatten_groups(conn: sqlite3.Connection, prefix: str = "") -> list[str]:
+    """Store equivalent of `config.flatten_groups`: sorted list of group paths."""
+    return list(iter_groups(conn, prefix=prefix))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def get_group_urls(conn: sqlite3.Connection, group_path: str) -> dict[str, str]:
+    """Store equivalent of `config.get_group_urls`: URL name -> URL, in original order."""
+    rows = conn.execute(
+        "SELECT name, url FROM urls WHERE group_path = ? ORDER BY position",
+        (group_path,),
+    )
+    return {name: url for name, url in rows}
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def iter_urls(conn: sqlite3.Connection) -> Iterator[tuple[str, str, str]]:
+    """Yield every (group_path, name, url) row in group order."""
+    yield from conn.execute("SELECT group_path, name, url FROM urls ORDER BY group_path, position")
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def add_urls(conn: sqlite3.Connection, rows: Iterable[tuple[str, str, str]]) -> None:
+    """Append (group_path, name, url) rows to the end of their groups, replacing same-named entries."""
+    with conn:
+        conn.executemany(
+            """INSERT OR REPLACE INTO urls (group_path, name, url, position)
+            VALUES (?1, ?2, ?3, (SELECT COALESCE(MAX(position) + 1, 0) FROM urls WHERE group_path = ?1))""",
+            rows,
+        )
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def remove_urls(conn: sqlite3.Connection, entries: Iterable[tuple[str, str]]) -> None:
+    """Delete (group_path, name) entries; missing entries are ignored."""
+    with conn:
+        conn.executemany("DELETE FROM urls WHERE group_path = ? AND name = ?", entries)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def remove_urls_by_url(conn: sqlite3.Connection, entries: Iterable[tuple[str, str, str]]) -> None:
+    """
+    Delete one row per (group_path, name, url) entry, matched on group and URL.
+
+    The row still named `name` is preferred, so renamed entries are found and a reused name holding a different URL
+    is left alone. Entries whose URL is no longer in the group are ignored.
+    """
+    with conn:
+        conn.executemany(
+            """DELETE FROM urls WHERE group_path = ?1 AND name = (
+                SELECT name FROM urls WHERE group_path = ?1 AND url = ?3 ORDER BY name = ?2 DESC, position LIMIT 1
+            )""",
+            entries,
+        )
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def import_toml(conn: sqlite3.Connection, toml_path: Path) -> int:
+    """Replace store contents with the groups in `toml_path`. Returns the number of URLs imported."""
+    data = load_toml(toml_path)
+
+    with conn:
+        conn.execute("DELETE FROM urls")
+        conn.executemany(
+            "INSERT OR REPLACE INTO urls (group_path, name, url, position) VALUES (?, ?, ?, ?)",
+            _with_positions(iter_url_rows(data)),
+        )
+        _mark_synced(conn, toml_path)
+
+    count = _url_count(conn)
+    logger.info("Imported {} URLs from {}", count, toml_path)
+    return count
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def export_toml(conn: sqlite3.Connection, toml_path: Path) -> int:
+    """
+    Write store contents to `toml_path` in urls.toml format. Returns the number of URLs exported.
+
+    Raises:
+        ValueError: If the store holds a layout TOML cannot represent (nothing is written)
+    """
+    rows = conn.execute("SELECT group_path, name, url FROM urls ORDER BY group_path, position").fetchall()
+
+    toml_path.parent.mkdir(parents=True, exist_ok=True)
+    toml_path.write_text(render_urls_toml(rows), encoding="utf-8")
+
+    with conn:
+        _mark_synced(conn, toml_path)
+
+    logger.info("Exported {} URLs to {}", len(rows), toml_path)
+    return len(rows)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def sync_toml(conn: sqlite3.Connection, toml_path: Path, prefer: str = PREFER_TOML) -> SyncResult:
+    """
+    Two-way sync between the store and `toml_path`.
+
+    Whichever side changed since the last sync wins. If both changed, `prefer` picks the winner and the other side's
+    rows that the winner does not have are reported as discarded.
+
+    Returns:
+        SyncResult with direction "import", "export" or "none"
+
+    Raises:
+        ValueError: If `prefer` is unknown, or the store cannot be exported as TOML
+    """
+    if prefer not in {PREFER_TOML, PREFER_STORE}:
+        raise ValueError(f"Unsupported sync preference: {prefer}")
+
+    toml_changed = toml_path.exists() and toml_path.stat().st_mtime_ns != _get_meta(conn, META_SYNCED_TOML_MTIME_NS)
+    store_changed = _get_meta(conn, META_REVISION) != _get_meta(conn, META_SYNCED_REVISION)
+
+    conflict = toml_changed and store_changed
+    discarded: list[tuple[str, str, str]] = []
+    if conflict:
+        store_rows = list(iter_urls(conn))
+        toml_rows = list(iter_url_rows(load_toml(toml_path)))
+        loser, winner = (store_rows, toml_rows) if prefer == PREFER_TOML else (toml_rows, store_rows)
+        winner_rows = set(winner)
+        discarded = [row for row in loser if row not in winner_rows]
+
+    if toml_changed and (not store_changed or prefer == PREFER_TOML):
+        count = import_toml(conn, toml_path)
+        return SyncResult(direction="import", url_count=count, conflict=conflict, discarded=discarded)
+
+    if store_changed or not toml_path.exists():
+        count = export_toml(conn, toml_path)
+        return SyncResult(direction="export", url_count=count, conflict=conflict, discarded=discarded)
+
+    return SyncResult(direction="none", url_count=_url_count(conn))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _with_positions(rows: Iterable[tuple[str, str, str]]) -> Iterator[tuple[str, str, str, int]]:
+    positions: dict[str, int] = {}
+    for group_path, name, url in rows:
+        position = positions.get(group_path, 0)
+        positions[group_path] = position + 1
+        yield group_path, name, url, position
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _mark_synced(conn: sqlite3.Connection, toml_path: Path) -> None:
+    conn.execute(
+        "UPDATE meta SET value = (SELECT value FROM meta WHERE key = ?) WHERE key = ?",
+        (META_REVISION, META_SYNCED_REVISION),
+    )
+    conn.execute(
+        "UPDATE meta SET value = ? WHERE key = ?",
+        (toml_path.stat().st_mtime_ns, META_SYNCED_TOML_MTIME_NS),
+    )
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _get_meta(conn: sqlite3.Connection, key: str) -> int:
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return int(row[0]) if row else 0
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _url_count(conn: sqlite3.Connection) -> int:
+    return int(conn.execute("SELECT COUNT(*) FROM urls").fetchone()[0])
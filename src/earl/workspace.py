@@ -0,0 +1,195 @@
+import json
+import os
+import tomllib
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from loguru import logger
+
+from earl.capture import DEFAULT_PROJECT_FILE_NAME
+from earl.config import get_project_index_file, load_toml
+
+DEFAULT_SCAN_WORKERS = 8
+
+PRUNED_DIR_NAMES = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        "node_modules",
+        ".venv",
+        "venv",
+        "__pycache__",
+        ".tox",
+        ".nox",
+        ".mypy_cache",
+        ".ruff_cache",
+        ".pytest_cache",
+        ".cache",
+        ".idea",
+        "target",
+        "dist",
+        "build",
+    }
+)
+
+
+# =====================================================================================================================
+@dataclass(frozen=True, slots=True)
+class ProjectEntry:
+    path: str
+    mtime_ns: int
+    url_count: int
+
+
+# =====================================================================================================================
+@dataclass(frozen=True, slots=True)
+class ScanResult:
+    entries: list[ProjectEntry]
+    added: int
+    updated: int
+    removed: int
+    unchanged: int
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def find_project_files(
+    root: Path,
+    *,
+    workers: int = DEFAULT_SCAN_WORKERS,
+    exclude: frozenset[str] = frozenset(),
+) -> dict[Path, int]:
+    """
+    Walk `root` in parallel and return every `.earl.toml` found, mapped to its mtime (ns).
+
+    Directories in PRUNED_DIR_NAMES or `exclude` are not descended into, nor are symlinked directories.
+    """
+    pruned = PRUNED_DIR_NAMES | exclude
+    found: dict[Path, int] = {}
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="earl-scan") as pool:
+        pending: set[Future[tuple[str, list[str], int | None]]] = {pool.submit(_scan_dir, str(root), pruned)}
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                directory, subdirs, mtime_ns = future.result()
+
+                if mtime_ns is not None:
+                    found[Path(directory) / DEFAULT_PROJECT_FILE_NAME] = mtime_ns
+
+                pending.update(pool.submit(_scan_dir, subdir, pruned) for subdir in subdirs)
+
+    return found
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def scan_projects(
+    root: Path,
+    *,
+    workers: int = DEFAULT_SCAN_WORKERS,
+    exclude: frozenset[str] = frozenset(),
+) -> ScanResult:
+    """
+    Index every `.earl.toml` under `root`, refreshing the project index incrementally.
+
+    Files whose mtime matches the index are not re-parsed; indexed files under `root` that are gone are dropped.
+    Entries outside `root` are kept, so several roots can share one index.
+    """
+    root = root.expanduser().resolve()
+    index_file = get_project_index_file()
+    indexed = {entry.path: entry for entry in load_project_index()}
+
+    found = find_project_files(root, workers=workers, exclude=exclude)
+
+    added = updated = unchanged = 0
+    for path, mtime_ns in found.items():
+        key = str(path)
+        previous = indexed.get(key)
+
+        if previous and previous.mtime_ns == mtime_ns:
+            unchanged += 1
+            continue
+
+        indexed[key] = ProjectEntry(path=key, mtime_ns=mtime_ns, url_count=_count_urls(path))
+        if previous:
+            updated += 1
+        else:
+            added += 1
+
+    found_keys = {str(path) for path in found}
+    stale = [key for key in indexed if Path(key).is_relative_to(root) and key not in found_keys]
+    for key in stale:
+        del indexed[key]
+
+    entries = sorted(indexed.values(), key=lambda entry: entry.path)
+    _save_project_index(index_file, entries)
+
+    return ScanResult(entries=entries, added=added, updated=updated, removed=len(stale), unchanged=unchanged)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def load_project_index() -> list[ProjectEntry]:
+    """Load indexed project files (empty if no scan has run yet)."""
+    index_file = get_project_index_file()
+    if not index_file.exists():
+        return []
+
+    try:
+        raw = json.loads(index_file.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        logger.warning("Ignoring unreadable project index at {}", index_file)
+        return []
+
+    entries: list[ProjectEntry] = []
+    for item in raw.get("projects", []) if isinstance(raw, dict) else []:
+        if not isinstance(item, dict):
+            continue
+        try:
+            entries.append(
+                ProjectEntry(path=str(item["path"]), mtime_ns=int(item["mtime_ns"]), url_count=int(item["url_count"]))
+            )
+        except (KeyError, TypeError, ValueError):
+            continue
+
+    return entries
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _scan_dir(directory: str, pruned: frozenset[str]) -> tuple[str, list[str], int | None]:
+    subdirs: list[str] = []
+    mtime_ns: int | None = None
+
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in pruned:
+                            subdirs.append(entry.path)
+                    elif entry.name == DEFAULT_PROJECT_FILE_NAME and entry.is_file():
+                        mtime_ns = entry.stat().st_mtime_ns
+                except OSError:
+                    continue
+    except OSError as e:
+        logger.debug("Skipping {}: {}", directory, e)
+
+    return directory, subdirs, mtime_ns
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _count_urls(path: Path) -> int:
+    try:
+        urls = load_toml(path).get("urls")
+    except (OSError, tomllib.TOMLDecodeError) as e:
+        logger.warning("Could not read {}: {}", path, e)
+        return 0
+
+    return len(urls) if isinstance(urls, list) else 0
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _save_project_index(path: Path, entries: list[ProjectEntry]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"projects": [asdict(entry) for entry in entries]}, indent=2), encoding="utf-8")
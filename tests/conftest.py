@@ -0,0 +1,13 @@
+from pathlib import Path
+
+import pytest
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@pytest.fixture
+def earl_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point EARL_DIR at an empty temp directory (urls.toml, urls.db and state files live here)."""
+    directory = tmp_path / "earl"
+    directory.mkdir()
+    monkeypatch.setenv("EARL_DIR", str(directory))
+    return directory
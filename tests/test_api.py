@@ -0,0 +1,82 @@
+import threading
+from pathlib import Path
+
+from earl import api
+from earl.api import _FileCache
+
+WAIT_SECONDS = 5
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_slow_load_does_not_block_other_keys(tmp_path: Path) -> None:
+    cache = _FileCache()
+    path = tmp_path / "source"
+    path.write_text("x", encoding="utf-8")
+    assert cache.get("cached", [path], lambda: "cached value") == "cached value"
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_loader() -> str:
+        started.set()
+        release.wait(WAIT_SECONDS)
+        return "slow value"
+
+    results: list[str] = []
+    thread = threading.Thread(target=lambda: results.append(cache.get("slow", [path], slow_loader)))
+    thread.start()
+    try:
+        assert started.wait(WAIT_SECONDS)
+        # Both a cached key and a fresh load of another key go through while "slow" is still loading
+        assert cache.get("cached", [path], lambda: "reloaded") == "cached value"
+        assert cache.get("other", [path], lambda: "other value") == "other value"
+        assert not results
+    finally:
+        release.set()
+        thread.join(WAIT_SECONDS)
+
+    assert results == ["slow value"]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_concurrent_callers_of_one_key_share_a_single_load(tmp_path: Path) -> None:
+    cache = _FileCache()
+    path = tmp_path / "source"
+    path.write_text("x", encoding="utf-8")
+
+    release = threading.Event()
+    loads: list[int] = []
+
+    def loader() -> str:
+        loads.append(1)
+        release.wait(WAIT_SECONDS)
+        return "value"
+
+    results: list[str] = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get("key", [path], loader))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(WAIT_SECONDS)
+
+    assert results == ["value"] * 4
+    assert len(loads) == 1
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_load_project_returns_independent_copies(tmp_path: Path) -> None:
+    project_file = tmp_path / ".earl.toml"
+    project_file.write_text(
+        '[[urls]]\nname = "GitHub"\nurl = "https://github.com"\n\n[[urls]]\nname = "Broken"\n',
+        encoding="utf-8",
+    )
+    api.clear_cache()
+
+    first = api.load_project(project_file)
+    first.urls.clear()
+    first.malformed.clear()
+
+    second = api.load_project(project_file)
+    assert [url.name for url in second.urls] == ["GitHub"]
+    assert len(second.malformed) == 1
@@ -0,0 +1,193 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from earl import store
+from earl.bookmarks import import_chrome_bookmarks
+from earl.cli import app
+from earl.config import iter_url_rows, load_toml, render_urls_toml
+
+BAR = "chrome.bookmark_bar"
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@pytest.fixture
+def bookmarks_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, earl_dir: Path) -> Path:
+    support_dir = tmp_path / "chrome"
+    (support_dir / "Default").mkdir(parents=True)
+    monkeypatch.setenv("EARL_CHROME_SUPPORT_DIR", str(support_dir))
+    return support_dir / "Default" / "Bookmarks"
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _write_bookmarks(path: Path, checksum: str, children: list[dict], mtime_ns: int) -> None:
+    path.write_text(json.dumps({"checksum": checksum, "roots": {"bookmark_bar": {"children": children}}}))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _link(node_id: str, name: str, url: str) -> dict:
+    return {"id": node_id, "type": "url", "name": name, "url": url}
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _folder(name: str, children: list[dict]) -> dict:
+    return {"type": "folder", "name": name, "children": children}
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _toml_rows(earl_dir: Path) -> list[tuple[str, str, str]]:
+    return list(iter_url_rows(load_toml(earl_dir / "urls.toml")))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_unchanged_file_is_skipped_by_stat_then_checksum(bookmarks_file: Path, earl_dir: Path) -> None:
+    _write_bookmarks(bookmarks_file, "c1", [_link("1", "GitHub", "https://github.com")], 1_000_000_000)
+
+    first = import_chrome_bookmarks("Default")
+    assert (first.skipped, first.added, first.removed) == (False, 1, 0)
+
+    assert import_chrome_bookmarks("Default").skipped
+
+    # Touched but identical: the stat check misses, Chrome's checksum still matches
+    urls_toml = (earl_dir / "urls.toml").read_text(encoding="utf-8")
+    os.utime(bookmarks_file, ns=(2_000_000_000, 2_000_000_000))
+    assert import_chrome_bookmarks("Default").skipped
+    assert (earl_dir / "urls.toml").read_text(encoding="utf-8") == urls_toml
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_incremental_import_applies_only_the_diff(bookmarks_file: Path, earl_dir: Path) -> None:
+    (earl_dir / "urls.toml").write_text('[mine]\nkeep = "https://keep.example"\n', encoding="utf-8")
+    children = [
+        _link("1", "Stays", "https://stays.example"),
+        _link("2", "Goes", "https://goes.example"),
+        _link("3", "Old title", "https://retitled.example"),
+    ]
+    _write_bookmarks(bookmarks_file, "c1", children, 1_000_000_000)
+    import_chrome_bookmarks("Default")
+
+    children = [
+        _link("1", "Stays", "https://stays.example"),
+        _link("3", "New title", "https://retitled.example"),
+        _folder("Work", [_link("4", "Added", "https://added.example")]),
+    ]
+    _write_bookmarks(bookmarks_file, "c2", children, 2_000_000_000)
+    result = import_chrome_bookmarks("Default")
+
+    # Node 3 changed title: removed and re-added
+    assert (result.skipped, result.added, result.removed) == (False, 2, 2)
+    assert sorted(_toml_rows(earl_dir)) == [
+        (BAR, "New title", "https://retitled.example"),
+        (BAR, "Stays", "https://stays.example"),
+        (f"{BAR}.work", "Added", "https://added.example"),
+        ("mine", "keep", "https://keep.example"),
+    ]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_incremental_import_into_store(bookmarks_file: Path, earl_dir: Path) -> None:
+    with store.open_store(earl_dir / "urls.db", create=True):
+        pass
+
+    _write_bookmarks(bookmarks_file, "c1", [_link("1", "A", "https://a.example")], 1_000_000_000)
+    import_chrome_bookmarks("Default")
+    _write_bookmarks(bookmarks_file, "c2", [_link("2", "B", "https://b.example")], 2_000_000_000)
+    result = import_chrome_bookmarks("Default")
+
+    assert result.target == earl_dir / "urls.db"
+    with store.open_store(earl_dir / "urls.db") as conn:
+        assert list(store.iter_urls(conn)) == [(BAR, "B", "https://b.example")]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_link_and_folder_with_the_same_key_are_both_kept(bookmarks_file: Path, earl_dir: Path) -> None:
+    children = [
+        _link("1", "work", "https://a.example"),
+        _folder("Work", [_link("2", "Inner", "https://b.example")]),
+    ]
+    _write_bookmarks(bookmarks_file, "c1", children, 1_000_000_000)
+    import_chrome_bookmarks("Default")
+
+    assert sorted(_toml_rows(earl_dir)) == [
+        (BAR, "work (2)", "https://a.example"),
+        (f"{BAR}.work", "Inner", "https://b.example"),
+    ]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_removal_matches_renamed_entries_by_url(bookmarks_file: Path, earl_dir: Path) -> None:
+    children = [_link("1", "", "https://a.example/"), _link("2", "Foo", "https://foo.example/")]
+    _write_bookmarks(bookmarks_file, "c1", children, 1_000_000_000)
+    import_chrome_bookmarks("Default")
+
+    # Renamed after import (as earl enrich does), and the old name reused for another URL
+    urls_toml = earl_dir / "urls.toml"
+    urls_toml.write_text(
+        render_urls_toml(
+            [
+                (BAR, "Page A", "https://a.example/"),
+                (BAR, "Bar", "https://foo.example/"),
+                (BAR, "Foo", "https://other.example/"),
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    _write_bookmarks(bookmarks_file, "c2", [], 2_000_000_000)
+    import_chrome_bookmarks("Default")
+
+    assert _toml_rows(earl_dir) == [(BAR, "Foo", "https://other.example/")]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_import_keeps_comments_and_layout_of_urls_toml(bookmarks_file: Path, earl_dir: Path) -> None:
+    urls_toml = earl_dir / "urls.toml"
+    hand_written = '# My links\n[work]\ngithub = "https://github.com"  # daily\n'
+    urls_toml.write_text(hand_written, encoding="utf-8")
+
+    _write_bookmarks(bookmarks_file, "c1", [_link("1", "A", "https://a.example")], 1_000_000_000)
+    import_chrome_bookmarks("Default")
+
+    text = urls_toml.read_text(encoding="utf-8")
+    assert text.startswith(hand_written)
+    assert f'[{BAR}]\nA = "https://a.example"\n' in text
+
+    _write_bookmarks(bookmarks_file, "c2", [], 2_000_000_000)
+    import_chrome_bookmarks("Default")
+
+    text = urls_toml.read_text(encoding="utf-8")
+    assert text.startswith(hand_written)
+    assert '"https://a.example"' not in text
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_link_moved_aside_for_a_later_folder(bookmarks_file: Path, earl_dir: Path) -> None:
+    _write_bookmarks(bookmarks_file, "c1", [_link("1", "work", "https://a.example")], 1_000_000_000)
+    import_chrome_bookmarks("Default")
+
+    children = [
+        _link("1", "work", "https://a.example"),
+        _folder("Work", [_link("2", "Inner", "https://b.example")]),
+    ]
+    _write_bookmarks(bookmarks_file, "c2", children, 2_000_000_000)
+    import_chrome_bookmarks("Default")
+
+    assert sorted(_toml_rows(earl_dir)) == [
+        (BAR, "work (2)", "https://a.example"),
+        (f"{BAR}.work", "Inner", "https://b.example"),
+    ]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_corrupt_bookmarks_file_is_reported(bookmarks_file: Path, earl_dir: Path) -> None:
+    bookmarks_file.write_text('{"roots": ', encoding="utf-8")
+
+    result = CliRunner().invoke(app, ["import", "chrome-bookmarks"])
+
+    assert result.exit_code == 1
+    assert "Could not read" in result.output
+    assert not (earl_dir / "urls.toml").exists()
@@ -0,0 +1,114 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from earl import browsers
+from earl.browsers import (
+    CHROME_APP_NAME,
+    LAUNCH_BINARY_COLD_START,
+    LAUNCH_COLD_START,
+    LAUNCH_OSASCRIPT,
+    LAUNCH_PROFILE_PROCESS,
+    open_urls_chrome,
+)
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="stub commands are shell scripts")
+
+# Each stub appends "<name> <args>" to the log, then sleeps and exits as its STUB_<NAME>_* variables say
+STUB_SCRIPT = """#!/bin/sh
+echo "{name} $*" >> "$STUB_LOG"
+sleep "${{STUB_{var}_SLEEP:-0}}"
+exit "${{STUB_{var}_EXIT:-0}}"
+"""
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@pytest.fixture
+def stub_log(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Put stub pgrep/osascript/open on PATH and a stub Chrome in $EARL_CHROME_BIN; returns their call log."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    for name in ("pgrep", "osascript", "open", "chrome"):
+        stub = bin_dir / name
+        stub.write_text(STUB_SCRIPT.format(name=name, var=name.upper()), encoding="utf-8")
+        stub.chmod(0o755)
+
+    log = tmp_path / "calls.log"
+    log.touch()
+    monkeypatch.setenv("STUB_LOG", str(log))
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("EARL_CHROME_BIN", str(bin_dir / "chrome"))
+    monkeypatch.setenv("EARL_CHROME_SUPPORT_DIR", str(tmp_path / "chrome-support"))
+    return log
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _calls(log: Path) -> list[str]:
+    return log.read_text(encoding="utf-8").splitlines()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_running_chrome_without_profile_uses_one_osascript_call(stub_log: Path) -> None:
+    launch = open_urls_chrome(["https://a.example", "https://b.example"])
+
+    assert launch is not None
+    assert launch.method == LAUNCH_OSASCRIPT
+    # The script spans several log lines; its trailing argv carries the incognito flag and the URLs
+    calls = _calls(stub_log)
+    assert calls[0] == f"pgrep -u {os.getuid()} -x {CHROME_APP_NAME}"
+    assert calls[1].startswith("osascript -l JavaScript -e ")
+    assert calls[-1].endswith(" 0 https://a.example https://b.example")
+    assert [call.split()[0] for call in calls if call.startswith(("open ", "chrome ", "osascript "))] == ["osascript"]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_running_chrome_with_profile_hands_off_to_the_profile_process(stub_log: Path) -> None:
+    launch = open_urls_chrome(["https://a.example"], profile="Profile 2")
+
+    assert launch is not None
+    assert launch.method == LAUNCH_PROFILE_PROCESS
+    assert _calls(stub_log)[1:] == ["chrome --profile-directory=Profile 2 --new-window https://a.example"]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_failed_hand_off_falls_back_to_open_na(stub_log: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("STUB_CHROME_EXIT", "1")
+
+    launch = open_urls_chrome(["https://a.example"], profile="Profile 2")
+
+    assert launch is not None
+    assert launch.method == LAUNCH_COLD_START
+    assert _calls(stub_log)[2:] == [
+        f"open -na {CHROME_APP_NAME} --args --profile-directory=Profile 2 --new-window https://a.example"
+    ]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_hand_off_nobody_picks_up_is_left_running_as_the_browser(
+    stub_log: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("STUB_CHROME_SLEEP", "5")
+    monkeypatch.setattr(browsers, "CHROME_HANDOFF_TIMEOUT_SECONDS", 0.2)
+
+    launch = open_urls_chrome(["https://a.example"], profile="Profile 2")
+
+    assert launch is not None
+    assert launch.method == LAUNCH_BINARY_COLD_START
+    assert launch.seconds < 2
+    # No second window via open -na
+    assert not any(call.startswith("open ") for call in _calls(stub_log))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_chrome_not_running_cold_starts_with_open_na(stub_log: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("STUB_PGREP_EXIT", "1")
+
+    launch = open_urls_chrome(["https://a.example"], profile="Profile 2")
+
+    assert launch is not None
+    assert launch.method == LAUNCH_COLD_START
+    assert _calls(stub_log)[1:] == [
+        f"open -na {CHROME_APP_NAME} --args --profile-directory=Profile 2 --new-window https://a.example"
+    ]
@@ -0,0 +1,208 @@
+import asyncio
+import threading
+from collections.abc import Iterator
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from earl.enrich import (
+    TitleParser,
+    fetch_title,
+    fetch_titles,
+    get_titles,
+    needs_title,
+    rename_group_urls,
+    rename_project_urls,
+)
+
+PAGES = {
+    "a/index.html": "<html><head><title>Page A</title></head><body></body></html>",
+    "og/index.html": '<html><head><title>Plain</title><meta property="og:title" content="Open Graph"></head></html>',
+    "late/index.html": "<html><head>" + "<!-- padding -->" * 512 + "<title>Too late</title></head></html>",
+    "data.json": '{"title": "not html"}',
+}
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+class _QuietHandler(SimpleHTTPRequestHandler):
+    requests: list[str] = []
+
+    def do_GET(self) -> None:
+        self.requests.append(self.path)
+        super().do_GET()
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@pytest.fixture
+def server(tmp_path: Path) -> Iterator[tuple[str, list[str]]]:
+    """Serve PAGES from a local HTTP server; yields (base URL, list of requested paths)."""
+    root = tmp_path / "www"
+    for name, contents in PAGES.items():
+        (root / name).parent.mkdir(parents=True, exist_ok=True)
+        (root / name).write_text(contents, encoding="utf-8")
+
+    requests: list[str] = []
+    handler = type("Handler", (_QuietHandler,), {"requests": requests})
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), partial(handler, directory=str(root)))
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}", requests
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize(
+    ("chunks", "title", "done"),
+    [
+        (["<html><head><title>  Hello\n  World </title>"], "Hello World", False),
+        (["<head><title>T</title>", '<meta name="og:title" content="OG">'], "OG", True),
+        (["<head><title>Tom &amp; Jerry</title></head>"], "Tom & Jerry", True),
+        (["<head><ti", "tle>Split</ti", "tle><body>"], "Split", True),
+        (["<html><body><p>no title</p>"], None, True),
+    ],
+)
+def test_title_parser(chunks: list[str], title: str | None, done: bool) -> None:
+    parser = TitleParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+
+    assert parser.best_title == title
+    assert parser.done is done
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize(
+    ("name", "url", "expected"),
+    [
+        ("https://a.example/x", "https://a.example/x", True),
+        ("a.example", "https://a.example/x", True),
+        ("a.example (2)", "https://a.example/y", True),
+        ("Dashboard", "https://a.example/x", False),
+    ],
+)
+def test_needs_title(name: str, url: str, expected: bool) -> None:
+    assert needs_title(name, url) is expected
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_fetch_title_from_local_server(server: tuple[str, list[str]]) -> None:
+    base_url, _ = server
+
+    assert fetch_title(f"{base_url}/a/") == "Page A"
+    assert fetch_title(f"{base_url}/og/") == "Open Graph"
+    assert fetch_title(f"{base_url}/data.json") is None
+    assert fetch_title(f"{base_url}/late/", max_bytes=1024) is None
+    assert fetch_title(f"{base_url}/late/") == "Too late"
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_get_titles_caches_results_and_failures(server: tuple[str, list[str]], earl_dir: Path) -> None:
+    base_url, requests = server
+    urls = [f"{base_url}/a/", f"{base_url}/missing/"]
+
+    assert get_titles(urls) == {urls[0]: "Page A", urls[1]: None}
+    assert get_titles(urls) == {urls[0]: "Page A", urls[1]: None}
+    assert sorted(requests) == ["/a/", "/missing/"]
+
+    get_titles(urls, ttl=-1)
+    assert len(requests) == 4
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_rename_project_urls_renames_each_entry_and_keeps_the_rest(tmp_path: Path) -> None:
+    project_file = tmp_path / ".earl.toml"
+    project_file.write_text(
+        """# project
+[options]
+browser = "chrome"  # no profile
+extra = 1
+
+[[urls]]
+name = "link"  # hand-added
+url = "https://a.example/"
+pinned = true
+
+[[urls]]
+name = "link"
+url = "https://b.example/"
+""",
+        encoding="utf-8",
+    )
+
+    renamed = rename_project_urls(
+        project_file, [("link", "https://a.example/", "Page A"), ("link", "https://b.example/", "Page B")]
+    )
+
+    expected = """# project
+[options]
+browser = "chrome"  # no profile
+extra = 1
+
+[[urls]]
+name = "Page A"  # hand-added
+url = "https://a.example/"
+pinned = true
+
+[[urls]]
+name = "Page B"
+url = "https://b.example/"
+"""
+    assert renamed == 2
+    assert project_file.read_text(encoding="utf-8") == expected
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_rename_project_urls_refuses_inline_arrays(tmp_path: Path) -> None:
+    project_file = tmp_path / ".earl.toml"
+    contents = 'urls = [{name = "link", url = "https://a.example/"}]\n'
+    project_file.write_text(contents, encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        rename_project_urls(project_file, [("link", "https://a.example/", "Page A")])
+
+    assert project_file.read_text(encoding="utf-8") == contents
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_fetch_titles_rejects_zero_concurrency_and_runs_with_one(server: tuple[str, list[str]]) -> None:
+    base_url, requests = server
+
+    with pytest.raises(ValueError, match="concurrency"):
+        asyncio.run(fetch_titles([f"{base_url}/a/"], concurrency=0))
+
+    urls = [f"{base_url}/a/", f"{base_url}/og/"]
+    assert asyncio.run(fetch_titles(urls, concurrency=1)) == {urls[0]: "Page A", urls[1]: "Open Graph"}
+    assert sorted(requests) == ["/a/", "/og/"]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_rename_group_urls_edits_urls_toml_in_place(earl_dir: Path) -> None:
+    urls_toml = earl_dir / "urls.toml"
+    urls_toml.write_text(
+        "# Work links\n"
+        "[work]\n"
+        "retries = 3\n"
+        '"https://a.example" = "https://a.example"  # from the bookmark bar\n'
+        'Docs = "https://docs.example"\n',
+        encoding="utf-8",
+    )
+
+    written = rename_group_urls([("work", "https://a.example", "Docs")])
+
+    assert written == urls_toml
+    assert urls_toml.read_text(encoding="utf-8") == (
+        "# Work links\n"
+        "[work]\n"
+        "retries = 3\n"
+        '"Docs (2)" = "https://a.example"  # from the bookmark bar\n'
+        'Docs = "https://docs.example"\n'
+    )
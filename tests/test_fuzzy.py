@@ -0,0 +1,89 @@
+import pytest
+
+from earl import fuzzy
+from earl.fuzzy import (
+    BONUS_BOUNDARY,
+    BONUS_BOUNDARY_DELIMITER,
+    BONUS_BOUNDARY_WHITE,
+    CHAR_DELIMITER,
+    CHAR_LOWER,
+    CHAR_NON_WORD,
+    CHAR_WHITE,
+    build_candidates,
+    fuzzy_score,
+    fuzzy_search,
+)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _texts(candidates: list[str], query: str, limit: int = 10) -> list[str]:
+    return [match.text for match in fuzzy_search(build_candidates(candidates), query, limit=limit)]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_boundary_bonus_follows_fzf_character_classes() -> None:
+    assert fuzzy._bonus_for(CHAR_WHITE, CHAR_LOWER) == BONUS_BOUNDARY_WHITE
+    assert fuzzy._bonus_for(CHAR_DELIMITER, CHAR_LOWER) == BONUS_BOUNDARY_DELIMITER
+    assert fuzzy._bonus_for(CHAR_NON_WORD, CHAR_LOWER) == BONUS_BOUNDARY
+    # Delimiters are past the non-word class, so they get the boundary bonus too
+    assert fuzzy._bonus_for(CHAR_WHITE, CHAR_DELIMITER) == BONUS_BOUNDARY_WHITE
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_fuzzy_score_prefers_word_boundaries_and_consecutive_runs() -> None:
+    boundary, scattered = build_candidates(["work > github", "xgxxxxhx"])
+
+    assert fuzzy_score(boundary, "gh") is not None
+    assert fuzzy_score(scattered, "gh") is not None
+    assert fuzzy_score(boundary, "git") > fuzzy_score(scattered, "gh")
+    assert fuzzy_score(boundary, "gith") > fuzzy_score(boundary, "gh")
+    assert fuzzy_score(boundary, "zz") is None
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_fuzzy_search_ranks_best_match_first() -> None:
+    candidates = ["docs > agitated hub", "work > github", "misc > gigahertz hub"]
+
+    assert _texts(candidates, "github")[0] == "work > github"
+    assert _texts(candidates, "github", limit=1) == ["work > github"]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_bitmask_rejects_candidates_before_scoring(monkeypatch: pytest.MonkeyPatch) -> None:
+    scored: list[str] = []
+    real_score = fuzzy.fuzzy_score
+
+    def spy(candidate: fuzzy.FuzzyCandidate, term: str) -> int | None:
+        scored.append(candidate.text)
+        return real_score(candidate, term)
+
+    monkeypatch.setattr(fuzzy, "fuzzy_score", spy)
+
+    assert _texts(["aws > console", "gcp > console"], "aws") == ["aws > console"]
+    assert scored == ["aws > console"]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_ties_go_to_the_shorter_then_earlier_candidate() -> None:
+    assert _texts(["work > abc (long)", "work > abc", "team > abc"], "abc") == [
+        "work > abc",
+        "team > abc",
+        "work > abc (long)",
+    ]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_multi_term_query_needs_every_term_and_sums_scores() -> None:
+    candidates = build_candidates(["work.aws > ec2", "work.aws > s3", "home > ec2"])
+
+    matches = fuzzy_search(candidates, "aws ec2")
+
+    assert [match.text for match in matches] == ["work.aws > ec2"]
+    assert matches[0].score == fuzzy_score(candidates[0], "aws") + fuzzy_score(candidates[0], "ec2")
+    # Terms are order-independent and case-insensitive
+    assert [match.text for match in fuzzy_search(candidates, "EC2 AWS")] == ["work.aws > ec2"]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_empty_query_returns_candidates_in_order() -> None:
+    assert _texts(["b", "a", "c"], "  ", limit=2) == ["b", "a"]
@@ -0,0 +1,119 @@
+from datetime import UTC, datetime, timedelta, tzinfo
+from itertools import count
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from earl import history
+from earl.capture import ProjectUrl
+from earl.cli import app
+from earl.history import (
+    OBJECTS_DIR_NAME,
+    Snapshot,
+    diff_snapshots,
+    find_snapshot,
+    list_snapshots,
+    load_snapshot_urls,
+    record_snapshot,
+)
+
+GITHUB = ProjectUrl(name="GitHub", url="https://github.com", pinned=True)
+DOCS = ProjectUrl(name="Docs", url="https://docs.example", pinned=False)
+MAIL = ProjectUrl(name="Mail", url="https://mail.example", pinned=False)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Advance the capture clock a minute per snapshot, so snapshot order does not depend on timing."""
+    minutes = count()
+
+    class _Clock(datetime):
+        @classmethod
+        def now(cls, tz: tzinfo | None = None) -> datetime:
+            return datetime(2026, 3, 1, 9, 0, tzinfo=UTC) + timedelta(minutes=next(minutes))
+
+    monkeypatch.setattr(history, "datetime", _Clock)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _record(urls: list[ProjectUrl], project: Path = Path("/work/.earl.toml")) -> Snapshot:
+    return record_snapshot(browser="chrome", chrome_profile="Work", project=project, urls=urls)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _object_files(earl_dir: Path) -> list[Path]:
+    return sorted((earl_dir / "history" / OBJECTS_DIR_NAME).rglob("*.json"))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_record_and_restore_round_trip(earl_dir: Path) -> None:
+    snapshot = _record([GITHUB, DOCS])
+
+    assert snapshot.browser == "chrome"
+    assert snapshot.chrome_profile == "Work"
+    assert len(snapshot.entries) == 2
+    assert list_snapshots() == [snapshot]
+    assert load_snapshot_urls(find_snapshot(snapshot.id)) == [GITHUB, DOCS]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_repeated_tabs_are_stored_once(earl_dir: Path) -> None:
+    first = _record([GITHUB, DOCS])
+    second = _record([DOCS, GITHUB, MAIL])
+
+    assert first.id != second.id
+    assert len(_object_files(earl_dir)) == 3
+    assert set(first.entries) < set(second.entries)
+    assert [snapshot.id for snapshot in list_snapshots()] == [second.id, first.id]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_list_snapshots_filters_by_project(earl_dir: Path) -> None:
+    work = _record([GITHUB], Path("/work/.earl.toml"))
+    _record([MAIL], Path("/home/.earl.toml"))
+
+    assert list_snapshots(Path("/work/.earl.toml")) == [work]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_find_snapshot_by_prefix(earl_dir: Path) -> None:
+    with pytest.raises(KeyError):
+        find_snapshot("20260301")
+
+    snapshot = _record([GITHUB])
+    assert find_snapshot(snapshot.id[:-3]) == snapshot
+
+    _record([DOCS])
+    with pytest.raises(ValueError, match="ambiguous"):
+        find_snapshot("20260301T09")
+    with pytest.raises(KeyError):
+        find_snapshot("nope")
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_diff_snapshots_reports_added_and_removed(earl_dir: Path) -> None:
+    old = _record([GITHUB, DOCS])
+    new = _record([DOCS, MAIL])
+
+    diff = diff_snapshots(old, new)
+
+    assert diff.added == [MAIL]
+    assert diff.removed == [GITHUB]
+    assert diff_snapshots(new, new).added == diff_snapshots(new, new).removed == []
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_capture_diff_against_itself_says_it_is_the_newest(earl_dir: Path) -> None:
+    old = _record([GITHUB])
+    new = _record([MAIL])
+
+    result = CliRunner().invoke(app, ["capture", "diff", new.id])
+    assert result.exit_code == 0
+    assert "already the newest snapshot" in result.output
+
+    result = CliRunner().invoke(app, ["capture", "diff", old.id])
+    assert result.exit_code == 0
+    assert "- GitHub" in result.output
+    assert "+ Mail" in result.output
@@ -0,0 +1,140 @@
+import threading
+import time
+
+import pytest
+
+from earl.config import match_groups
+from earl.scheduler import LaunchJob, run_launches
+
+GROUPS = ["news", "work.aws", "work.ci", "work.gcp", "personal.finance"]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize(
+    ("selectors", "expected"),
+    [
+        (["work.aws"], ["work.aws"]),
+        (["work.*"], ["work.aws", "work.ci", "work.gcp"]),
+        (["work.?ws", "news"], ["work.aws", "news"]),
+        (["re:^work\\.(ci|gcp)$"], ["work.ci", "work.gcp"]),
+        (["re:finance"], ["personal.finance"]),
+        (["news", "work.*", "work.aws", "re:news"], ["news", "work.aws", "work.ci", "work.gcp"]),
+        (["nothing.*"], []),
+    ],
+)
+def test_match_groups(selectors: list[str], expected: list[str]) -> None:
+    assert match_groups(GROUPS, selectors) == expected
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_match_groups_rejects_bad_regex() -> None:
+    with pytest.raises(ValueError):
+        match_groups(GROUPS, ["re:work.("])
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+class _Recorder:
+    """Stub launch callable tracking concurrency (windows and tabs in flight) and start times."""
+
+    def __init__(self, duration: float = 0.05) -> None:
+        self.duration = duration
+        self.starts: list[float] = []
+        self.max_windows = 0
+        self.max_tabs = 0
+        self._windows = 0
+        self._tabs = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, urls: list[str]) -> None:
+        with self._lock:
+            self.starts.append(time.monotonic())
+            self._windows += 1
+            self._tabs += len(urls)
+            self.max_windows = max(self.max_windows, self._windows)
+            self.max_tabs = max(self.max_tabs, self._tabs)
+
+        time.sleep(self.duration)
+
+        with self._lock:
+            self._windows -= 1
+            self._tabs -= len(urls)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _jobs(launch: _Recorder, tab_counts: list[int]) -> list[LaunchJob]:
+    return [
+        LaunchJob(label=f"g{i}", urls=[f"https://{i}.example/{n}" for n in range(count)], launch=launch)
+        for i, count in enumerate(tab_counts)
+    ]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_run_launches_caps_windows() -> None:
+    launch = _Recorder()
+    timings = run_launches(_jobs(launch, [1] * 6), max_windows=2, max_tabs=100, interval=0, settle=0)
+
+    assert [timing.label for timing in timings] == [f"g{i}" for i in range(6)]
+    assert all(timing.ok for timing in timings)
+    assert launch.max_windows == 2
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_run_launches_caps_tabs() -> None:
+    launch = _Recorder()
+    run_launches(_jobs(launch, [3, 3, 3, 3]), max_windows=4, max_tabs=6, interval=0, settle=0)
+
+    assert launch.max_tabs == 6
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_run_launches_oversized_window_still_opens() -> None:
+    launch = _Recorder(duration=0)
+    timings = run_launches(_jobs(launch, [2, 10, 2]), max_windows=2, max_tabs=4, interval=0, settle=0)
+
+    assert [timing.tab_count for timing in timings] == [2, 10, 2]
+    assert launch.max_tabs <= 10
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_run_launches_paces_starts() -> None:
+    launch = _Recorder(duration=0)
+    run_launches(_jobs(launch, [1] * 4), max_windows=4, max_tabs=100, interval=0.05, settle=0)
+
+    starts = sorted(launch.starts)
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:], strict=False)]
+    assert min(gaps) >= 0.045
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_run_launches_skips_settle_when_nothing_is_waiting() -> None:
+    launch = _Recorder(duration=0)
+
+    started = time.monotonic()
+    run_launches(_jobs(launch, [1]), interval=0, settle=5)
+
+    assert time.monotonic() - started < 1
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_run_launches_settles_between_queued_windows() -> None:
+    launch = _Recorder(duration=0)
+    run_launches(_jobs(launch, [1, 1]), max_windows=1, interval=0, settle=0.2)
+
+    starts = sorted(launch.starts)
+    assert starts[1] - starts[0] >= 0.19
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_run_launches_reports_failures() -> None:
+    def fail(urls: list[str]) -> None:
+        raise RuntimeError("browser went away")
+
+    timings = run_launches([LaunchJob(label="bad", urls=["https://x.example"], launch=fail)], interval=0, settle=0)
+
+    assert [timing.ok for timing in timings] == [False]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_run_launches_rejects_zero_caps() -> None:
+    with pytest.raises(ValueError):
+        run_launches([], max_windows=0)
@@ -0,0 +1,153 @@
+import os
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from earl import store
+
+URLS_TOML = """[work]
+github = "https://github.com"
+
+[news]
+hn = "https://news.ycombinator.com"
+"""
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _write_toml(path: Path, contents: str, mtime_ns: int) -> None:
+    path.write_text(contents, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@pytest.fixture
+def synced(earl_dir: Path) -> tuple[Path, Path]:
+    """A store freshly imported from urls.toml (both sides in sync)."""
+    toml_path = earl_dir / "urls.toml"
+    db_path = earl_dir / "urls.db"
+    _write_toml(toml_path, URLS_TOML, 1_000_000_000)
+
+    with store.open_store(db_path, create=True) as conn:
+        store.import_toml(conn, toml_path)
+
+    return toml_path, db_path
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_sync_does_nothing_when_neither_side_changed(synced: tuple[Path, Path]) -> None:
+    toml_path, db_path = synced
+
+    with store.open_store(db_path, create=True) as conn:
+        result = store.sync_toml(conn, toml_path)
+
+    assert result == store.SyncResult(direction="none", url_count=2)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_sync_imports_when_only_toml_changed(synced: tuple[Path, Path]) -> None:
+    toml_path, db_path = synced
+    _write_toml(toml_path, URLS_TOML + 'lobsters = "https://lobste.rs"\n', 2_000_000_000)
+
+    with store.open_store(db_path, create=True) as conn:
+        result = store.sync_toml(conn, toml_path, prefer=store.PREFER_STORE)
+        urls = store.get_group_urls(conn, "news")
+
+    assert result.direction == "import"
+    assert urls == {"hn": "https://news.ycombinator.com", "lobsters": "https://lobste.rs"}
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_sync_exports_when_only_store_changed(synced: tuple[Path, Path]) -> None:
+    toml_path, db_path = synced
+
+    with store.open_store(db_path, create=True) as conn:
+        store.add_urls(conn, [("work", "ci", "https://ci.example")])
+        result = store.sync_toml(conn, toml_path)
+
+    assert result == store.SyncResult(direction="export", url_count=3)
+    assert 'ci = "https://ci.example"' in toml_path.read_text(encoding="utf-8")
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize(
+    ("prefer", "direction", "expected_news"),
+    [
+        (store.PREFER_TOML, "import", {"hn": "https://news.ycombinator.com", "toml": "https://toml.example"}),
+        (store.PREFER_STORE, "export", {"hn": "https://news.ycombinator.com", "store": "https://store.example"}),
+    ],
+)
+def test_sync_conflict_uses_preference(
+    synced: tuple[Path, Path], prefer: str, direction: str, expected_news: dict[str, str]
+) -> None:
+    toml_path, db_path = synced
+    _write_toml(toml_path, URLS_TOML + 'toml = "https://toml.example"\n', 2_000_000_000)
+
+    with store.open_store(db_path, create=True) as conn:
+        store.add_urls(conn, [("news", "store", "https://store.example")])
+        result = store.sync_toml(conn, toml_path, prefer=prefer)
+        news = store.get_group_urls(conn, "news")
+
+    assert result.direction == direction
+    assert news == expected_news
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_sync_rejects_unknown_preference(synced: tuple[Path, Path]) -> None:
+    toml_path, db_path = synced
+
+    with store.open_store(db_path, create=True) as conn, pytest.raises(ValueError):
+        store.sync_toml(conn, toml_path, prefer="newest")
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_readers_do_not_wait_for_a_writer(synced: tuple[Path, Path]) -> None:
+    _, db_path = synced
+
+    writer = sqlite3.connect(db_path, timeout=0)
+    try:
+        writer.execute("BEGIN IMMEDIATE")
+        writer.execute("INSERT INTO urls VALUES ('work', 'pending', 'https://pending.example', 9)")
+
+        with store.open_store(db_path) as conn:
+            assert store.get_group_urls(conn, "work") == {"github": "https://github.com"}
+    finally:
+        writer.rollback()
+        writer.close()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_export_refuses_url_named_like_a_subgroup(synced: tuple[Path, Path]) -> None:
+    toml_path, db_path = synced
+    before = toml_path.read_text(encoding="utf-8")
+
+    with store.open_store(db_path, create=True) as conn:
+        store.add_urls(conn, [("work", "aws", "https://aws.example"), ("work.aws", "console", "https://c.example")])
+        with pytest.raises(ValueError, match="both a URL and a subgroup"):
+            store.export_toml(conn, toml_path)
+
+    assert toml_path.read_text(encoding="utf-8") == before
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_sync_conflict_reports_discarded_rows(synced: tuple[Path, Path]) -> None:
+    toml_path, db_path = synced
+    _write_toml(toml_path, URLS_TOML + 'toml = "https://toml.example"\n', 2_000_000_000)
+
+    with store.open_store(db_path, create=True) as conn:
+        store.add_urls(conn, [("news", "store", "https://store.example")])
+        result = store.sync_toml(conn, toml_path, prefer=store.PREFER_TOML)
+
+    assert result.conflict
+    assert result.discarded == [("news", "store", "https://store.example")]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_sync_without_conflict_discards_nothing(synced: tuple[Path, Path]) -> None:
+    toml_path, db_path = synced
+
+    with store.open_store(db_path, create=True) as conn:
+        store.add_urls(conn, [("work", "ci", "https://ci.example")])
+        result = store.sync_toml(conn, toml_path)
+
+    assert (result.conflict, result.discarded) == (False, [])